@@ -18,8 +18,9 @@
 #######################################################################################################################
 """
 
-import collections
+import gc
 import logging
+import multiprocessing
 import os
 import time
 import pandas as pd
@@ -69,6 +70,10 @@ adjust_reactive_comp = [
 # Path where a spreadsheet detailing the contingencies are stored (and empty example is stored in the Python package)
 pth_Contingencies = os.path.join(project_directory, 'Contingencies.xlsx')
 
+# Set to True to store a processed copy of the contingencies workbook alongside it (<workbook>.pkl) which is then used
+# in place of re-reading the workbook on subsequent runs, the copy is recreated whenever the workbook is modified.
+use_cache = False
+
 # Results paths where results from each of the study case will be stored
 pth_results = [
 	os.path.join(project_directory, 'Results_SVHW(BC).xlsx'),
@@ -87,12 +92,137 @@ pth_results = [
 # only one number is included in the list then studies will only be run for that single study case.
 selector = [9]
 
+# Number of PSSE licences available to the user, this limits the number of SAV cases that can be studied at the same
+# time (each in its own process) when multiple cases are included in the selector.
+psse_licences = 4
+
+# Number of processes to use when testing the contingencies for a study case, by default the contingencies are tested
+# in series.  Each process loads its own copy of the SAV case and therefore requires its own PSSE licence in addition
+# to the licence used by the main process, the number of processes is therefore limited to <psse_licences> - 1.
+n_procs = 1
+
+# PSSE holds process wide state and so worker processes are always started fresh rather than forked from a process
+# which may already have PSSE initialised
+mp_context = multiprocessing.get_context('spawn')
+
 # Contains details of the busbars to include and these are then used to focus the area of the analysis for voltage
 # compliance checking.
 pth_busbar_list = os.path.join(project_directory, 'Model_Review.xlsx')
 
+# Attributes of the PSSE data classes which are populated with a new column for each contingency that is tested
+contingency_result_attributes = ('df', 'df_status', 'df_loading', 'df_state', 'df_voltage_steady', 'df_voltage_step')
+
+# Handles held by each worker process when SAV cases or contingencies are processed in parallel
+worker_study = dict()
 
-def main(cont_workbook, psse_sav_case, target_workbook, adjust_reactive, pth_busbars=str()):
+
+def get_psse_data(sid):
+	"""
+		Obtain data for all elements in the currently loaded PSSE case
+	:param int sid:  Bus subsystem to use when retrieving data from PSSE
+	:return dict psse_data:  Dictionary in the format {name: data class} for all of the data
+	"""
+	psse_data = dict()
+	psse_data['bus_data'] = optimisation.psse.BusData(sid=sid)
+	psse_data['machine_data'] = optimisation.psse.MachineData(sid=sid)
+	psse_data['circuit_data'] = optimisation.psse.BranchData(flag=2, sid=sid)
+	psse_data['tx2_data'] = optimisation.psse.BranchData(flag=6, tx=True, sid=sid)
+	psse_data['tx3_data'] = optimisation.psse.Tx3Data(sid=sid)
+	psse_data['tx3_wind_data'] = optimisation.psse.Tx3WndData(sid=sid)
+	psse_data['fixed_shunt_data'] = optimisation.psse.ShuntData(fixed=True, sid=sid)
+	psse_data['switched_shunt_data'] = optimisation.psse.ShuntData(fixed=False, sid=sid)
+	return psse_data
+
+
+def run_contingency(psse_case, contingency, psse_data, adjust_reactive):
+	"""
+		Applies the outage for a single contingency, tests it and then reloads the SAV case ready for the next one
+	:param optimisation.psse.PsseControl psse_case:  Handle to the loaded PSSE case
+	:param optimisation.psse.Contingency contingency:  Contingency to be tested
+	:param dict psse_data:  Data classes for the PSSE case as returned by <get_psse_data>
+	:param bool adjust_reactive:  Whether the reactive compensation should be adjusted to maintain voltages or not
+	:return None:
+	"""
+	contingency.setup_contingency(
+		circuit_data=psse_data['circuit_data'],
+		tx2_data=psse_data['tx2_data'],
+		tx3_data=psse_data['tx3_data'],
+		bus_data=psse_data['bus_data'],
+		fixed_shunt_data=psse_data['fixed_shunt_data'],
+		switched_shunt_data=psse_data['switched_shunt_data'],
+		tx3_wind_data=psse_data['tx3_wind_data']
+	)
+	contingency.test_contingency(
+		psse=psse_case, bus_data=psse_data['bus_data'], circuit_data=psse_data['circuit_data'],
+		tx2_data=psse_data['tx2_data'], tx3_wind_data=psse_data['tx3_wind_data'],
+		machine_data=psse_data['machine_data'], adjust_reactive=adjust_reactive
+	)
+
+	# Rather than restoring each element it is quicker to just reload the solved base case snapshot
+	# It also avoids a potential error where circuits are not necessarily switched back in
+	psse_case.restore_snapshot()
+	return None
+
+
+def initialise_worker(psse_sav_case, busbars_to_consider, adjust_reactive, pth_logs=str(), uid=str()):
+	"""
+		Run once by each worker process to set up logging for the process, load its own copy of the PSSE case and
+		obtain the base case data which the contingencies are then tested against
+	:param str psse_sav_case:  Path to psse SAV case (or snapshot of the solved base case) which is reloaded after
+		each contingency
+	:param tuple busbars_to_consider:  Busbars to include in the bus subsystem
+	:param bool adjust_reactive:  Whether the reactive compensation should be adjusted to maintain voltages or not
+	:param str pth_logs:  (optional=str()) Path to where all log files will be stored, if not provided then no log
+		files are created for the worker process
+	:param str uid:  (optional=str()) Unique identifier for the log files, the process ID is appended to this
+	:return None:
+	"""
+	# Handle to logger is retained so that logging is not shut down for the life of the worker process
+	if pth_logs:
+		worker_study['logger'] = optimisation.Logger(pth_logs=pth_logs, uid='{}_{}'.format(uid, os.getpid()))
+
+	psse_case = optimisation.psse.PsseControl()
+	psse_case.load_data_case(pth_sav=psse_sav_case)
+	psse_case.define_bus_subsystem(busbars=busbars_to_consider)
+	# Base case has already been confirmed as convergent by the main process
+	_ = psse_case.run_load_flow()
+	psse_case.save_base_voltages()
+
+	worker_study['psse_case'] = psse_case
+	worker_study['psse_data'] = get_psse_data(sid=psse_case.sid)
+	worker_study['adjust_reactive'] = adjust_reactive
+	return None
+
+
+def test_contingency_worker(contingency):
+	"""
+		Tests a single contingency within a worker process and returns the results so they can be combined with the
+		data held by the main process
+	:param optimisation.psse.Contingency contingency:  Contingency to be tested
+	:return (str, bool, bool, dict), (name, convergent_v_step, convergent_v_steady, results):  Convergence of the
+		contingency and the results in the format {(data name, attribute): pd.Series}
+	"""
+	psse_data = worker_study['psse_data']
+	run_contingency(
+		psse_case=worker_study['psse_case'], contingency=contingency, psse_data=psse_data,
+		adjust_reactive=worker_study['adjust_reactive']
+	)
+
+	# Results are removed from the worker DataFrames once extracted so they do not keep growing
+	results = dict()
+	for data_name, data in psse_data.items():
+		for attr in contingency_result_attributes:
+			df = getattr(data, attr, None)
+			if df is not None and contingency.name in df.columns:
+				results[(data_name, attr)] = df.pop(contingency.name)
+
+	return contingency.name, contingency.convergent_v_step, contingency.convergent_v_steady, results
+
+
+def main(
+		cont_workbook, psse_sav_case, target_workbook, adjust_reactive, pth_busbars=str(), n_procs=1,
+		contingency_data=None, pth_logs=str(), uid=str()
+):
 	"""
 		Main function
 	:param str cont_workbook: Path to workbook which contains contingency details
@@ -100,6 +230,11 @@ def main(cont_workbook, psse_sav_case, target_workbook, adjust_reactive, pth_bus
 	:param str target_workbook: Path where results should be saved
 	:param bool adjust_reactive:  Whether the reactive compensation should be adjusted to maintain voltages or not
 	:param str pth_busbars:  Path to file where a list of busbars are located
+	:param int n_procs:  (optional=1) Number of processes to test the contingencies across, 1 tests them in series
+	:param optimisation.file_handling.ImportContingencies contingency_data:  (optional=None) Contingencies already
+		imported from cont_workbook, if not provided then they are imported from the workbook
+	:param str pth_logs:  (optional=str()) Path where the log files for any worker processes are stored
+	:param str uid:  (optional=str()) Unique identifier for the log files of any worker processes
 	:return str target_workbook:  Path to excel file created as part of study
 	"""
 
@@ -127,9 +262,9 @@ def main(cont_workbook, psse_sav_case, target_workbook, adjust_reactive, pth_bus
 			msg0 = (
 				'The loaded PSSE case {} has the following busbars islanded in the base case:'.format(psse_sav_case)
 			)
-			msg1 = '\n'.join([
+			msg1 = '\n'.join(
 				'\t - Busbar: {}'.format(bus) for bus in islanded_busbars[optimisation.constants.Busbars.bus]
-			])
+			)
 			msg = '{}\n{}'.format(msg0, msg1)
 			logger.critical(msg)
 			raise ValueError('Check PSSE SAV Case - Islanded busbars')
@@ -141,30 +276,35 @@ def main(cont_workbook, psse_sav_case, target_workbook, adjust_reactive, pth_bus
 
 	# Obtain data for all elements in initial conditions (prior to any contingencies or balancing of reactive
 	# compensation)
-	bus_data = optimisation.psse.BusData(sid=psse_case.sid)
-	machine_data = optimisation.psse.MachineData(sid=psse_case.sid)
-	circuit_data = optimisation.psse.BranchData(flag=2, sid=psse_case.sid)
-	tx2_data = optimisation.psse.BranchData(flag=6, tx=True, sid=psse_case.sid)
-	tx3_data = optimisation.psse.Tx3Data(sid=psse_case.sid)
-	tx3_wind_data = optimisation.psse.Tx3WndData(sid=psse_case.sid)
-	fixed_shunt_data = optimisation.psse.ShuntData(fixed=True, sid=psse_case.sid)
-	switched_shunt_data = optimisation.psse.ShuntData(fixed=False, sid=psse_case.sid)
+	psse_data = get_psse_data(sid=psse_case.sid)
+	bus_data = psse_data['bus_data']
+	machine_data = psse_data['machine_data']
+	circuit_data = psse_data['circuit_data']
+	tx2_data = psse_data['tx2_data']
+	tx3_data = psse_data['tx3_data']
+	tx3_wind_data = psse_data['tx3_wind_data']
+	fixed_shunt_data = psse_data['fixed_shunt_data']
+	switched_shunt_data = psse_data['switched_shunt_data']
 
 	# Import workbook of contingency details identifying those elements which need to be switched out / switched in
-	logger.info('Importing details of all contingencies from workbook {}'.format(cont_workbook))
-	contingency_data = optimisation.file_handling.ImportContingencies(pth=cont_workbook)
-	contingency_circuits_details = collections.OrderedDict()
+	if contingency_data is None:
+		logger.info('Importing details of all contingencies from workbook {}'.format(cont_workbook))
+		contingency_data = optimisation.file_handling.ImportContingencies(pth=cont_workbook, use_cache=use_cache)
+	contingency_circuits_details = dict()
+
+	# Busbars which should be excluded when adjusting the reactive power grouped by the contingency they relate to
+	if pth_busbars:
+		# noinspection PyUnboundLocalVariable
+		busbars_to_ignore_by_cont = df_busbars.groupby('Contingency').groups
+	else:
+		busbars_to_ignore_by_cont = dict()
 
 	# Process imported contingencies to identify associated elements in PSSE case and assign to a Contingency class
 	for cont_name in contingency_data.contingency_names:
-		logger.debug('Processing contingency: {}'.format(cont_name))
+		logger.debug('Processing contingency: %s', cont_name)
 
 		# Check if contingency has any busbars which should be excluded when adjusting the reactive power
-		if pth_busbars:
-			# noinspection PyUnboundLocalVariable
-			busbars_to_ignore = tuple(df_busbars[df_busbars['Contingency'] == cont_name].index)
-		else:
-			busbars_to_ignore = tuple()
+		busbars_to_ignore = tuple(busbars_to_ignore_by_cont.get(cont_name, tuple()))
 
 		# Setup contingency by switching out the elements
 		circuits, tx2, tx3, busbars, fixed_shunts, switched_shunts = contingency_data.group_contingencies_by_name(
@@ -175,46 +315,84 @@ def main(cont_workbook, psse_sav_case, target_workbook, adjust_reactive, pth_bus
 		contingency_circuits_details[cont_name] = contingency
 	logger.info('All contingencies from workbook {} imported'.format(cont_workbook))
 
-	# Empty DataFrame to use for populating details of whether the contingency was convergent, circuit / shunt switching
-	# used to keep track of whether shunt or normal asset outage for analysis against voltage limits.
+	# List populated with details of whether each contingency was convergent in the format (name, message, convergent)
+	# and converted to a DataFrame once all tested, circuit / shunt switching used to keep track of whether shunt or
+	# normal asset outage for analysis against voltage limits.
+	convergence_rows = list()
 	circuit_switching = list()
 	shunt_switching = list()
-	contingency_convergence = pd.DataFrame(
-		index=contingency_circuits_details.keys(), columns=(constants.Excel.message, constants.Excel.convergence)
-	)
-	# Add Base case message
-	contingency_convergence.loc[constants.Contingency.bc, constants.Excel.message] = constants.Contingency.convergent
-	contingency_convergence.loc[constants.Contingency.bc, constants.Excel.convergence] = True
-
-	# Loop through all contingencies, apply outage, run load flow, check for reactive compensation requirements
-	for name, contingency in contingency_circuits_details.iteritems():
-
-		logger.info('Testing contingency {}'.format(name))
-		if contingency.voltage_control_contingency:
-			shunt_switching.append(name)
-		else:
-			circuit_switching.append(name)
-
-		contingency.setup_contingency(
-			circuit_data=circuit_data,
-			tx2_data=tx2_data,
-			tx3_data=tx3_data,
-			bus_data=bus_data,
-			fixed_shunt_data=fixed_shunt_data,
-			switched_shunt_data=switched_shunt_data,
-			tx3_wind_data=tx3_wind_data
-		)
-		contingency.test_contingency(
-			psse=psse_case, bus_data=bus_data, circuit_data=circuit_data, tx2_data=tx2_data,
-			tx3_wind_data=tx3_wind_data, machine_data=machine_data, adjust_reactive=adjust_reactive
+	# Results returned by worker processes in the format {(data name, attribute): {contingency: pd.Series}} which are
+	# added to the DataFrames together once all contingencies have been tested
+	parallel_columns = dict()
+
+	# Snapshot of the solved base case is restored after each contingency and shared with any worker processes, the
+	# base case voltages are also kept to warm start any contingency load flow which diverges
+	psse_case.save_snapshot()
+	psse_case.save_base_voltages()
+
+	# If running in parallel then each worker process loads its own copy of the SAV case and the contingencies are
+	# dispatched to them, results are returned in the same order as the contingencies
+	# The main process keeps its own PSSE case loaded and so one licence is always left for it
+	pool = None
+	parallel_results = None
+	n_procs = min(n_procs, psse_licences - 1)
+	if n_procs > 1:
+		logger.info('Testing contingencies across {} processes'.format(n_procs))
+		pool = mp_context.Pool(
+			processes=n_procs, initializer=initialise_worker,
+			initargs=(
+				psse_case.snapshot or psse_sav_case, tuple(busbars_to_consider), adjust_reactive, pth_logs, uid
+			)
 		)
+		parallel_results = pool.imap(test_contingency_worker, contingency_circuits_details.values())
 
-		# Rather than restoring it is quicker to just reload the SAV case
-		# It also avoids a potential error where circuits are not necessarily switched back in
-		psse_case.load_data_case()
-		# Update DataFrame with contingency convergence details
-		contingency_convergence.loc[name, constants.Excel.message] = contingency.convergence_message
-		contingency_convergence.loc[name, constants.Excel.convergence] = contingency.convergent
+	# Loop through all contingencies, apply outage, run load flow, check for reactive compensation requirements
+	try:
+		for name, contingency in contingency_circuits_details.items():
+
+			logger.info('Testing contingency %s', name)
+			if contingency.voltage_control_contingency:
+				shunt_switching.append(name)
+			else:
+				circuit_switching.append(name)
+
+			if pool is None:
+				run_contingency(
+					psse_case=psse_case, contingency=contingency, psse_data=psse_data, adjust_reactive=adjust_reactive
+				)
+			else:
+				# Combine results from the worker process with the data held for the main PSSE case
+				_, contingency.convergent_v_step, contingency.convergent_v_steady, results = next(parallel_results)
+				for key, values in results.items():
+					parallel_columns.setdefault(key, dict())[name] = values
+
+			# Add contingency convergence details
+			convergence_rows.append((name, contingency.convergence_message, contingency.convergent))
+	finally:
+		if pool is not None:
+			pool.terminate()
+			pool.join()
+		psse_case.remove_snapshot()
+
+	# Every contingency adds a column to each of the results DataFrames, rather than the DataFrames being extended one
+	# column at a time the results from worker processes are added in a single step and those updated in this process
+	# are consolidated so that the compliance checks and export do not work on one block per contingency
+	for (data_name, attr), columns in parallel_columns.items():
+		df = getattr(psse_data[data_name], attr)
+		setattr(psse_data[data_name], attr, pd.concat([df, pd.DataFrame(data=columns, index=df.index)], axis=1))
+	if pool is None:
+		for data in psse_data.values():
+			for attr in contingency_result_attributes:
+				df = getattr(data, attr, None)
+				if df is not None:
+					setattr(data, attr, df.copy())
+
+	# Add Base case message and produce DataFrame of convergence details for all contingencies
+	convergence_rows.append((constants.Contingency.bc, constants.Contingency.convergent, True))
+	contingency_convergence = pd.DataFrame(
+		data=convergence_rows,
+		columns=(constants.Contingency.header, constants.Excel.message, constants.Excel.convergence)
+	).set_index(constants.Contingency.header).rename_axis(None)
 
 	# Loop through all results data and confirm compliance
 	compliance = list()
@@ -237,12 +415,16 @@ def main(cont_workbook, psse_sav_case, target_workbook, adjust_reactive, pth_bus
 	for data_set in (bus_data, circuit_data, tx2_data, tx3_wind_data):
 		compliance.append(data_set.check_compliance(cont_names=all_cont_names))
 
-	# Combine compliance results into a single dataset
-	contingency_compliance = pd.concat([contingency_convergence] + compliance, axis=1, sort=True)
+	# Combine compliance results into a single dataset, every compliance check covers a subset of the contingencies
+	# and so each is aligned to the sorted contingency index once so the frames are joined without further sorting
+	cont_index = contingency_convergence.index.sort_values()
+	contingency_compliance = pd.concat(
+		[df.reindex(cont_index) for df in [contingency_convergence] + compliance], axis=1, sort=False
+	)
 
 	# Data to write is formatted into a dictionary with the associated name to use
 	c = optimisation.constants.Excel
-	results_data = collections.OrderedDict()
+	results_data = dict()
 	results_data[c.voltage_steady] = bus_data.df_voltage_steady
 	results_data[c.voltage_step] = bus_data.df_voltage_step
 	results_data[c.busbars] = bus_data.df_state
@@ -265,6 +447,58 @@ def main(cont_workbook, psse_sav_case, target_workbook, adjust_reactive, pth_bus
 	return target_workbook
 
 
+def initialise_case_worker(pth_logs, uid, contingency_data):
+	"""
+		Run once by each worker process when SAV cases are studied in parallel, sets up logging for the process and
+		initialises its own PSSE session
+	:param str pth_logs:  Path to where all log files will be stored
+	:param str uid:  Unique identifier for the log files, the process ID is appended to this
+	:param optimisation.file_handling.ImportContingencies contingency_data:  Contingencies imported by the parent
+	:return None:
+	"""
+	# Handle to logger is retained so that logging is not shut down for the life of the worker process
+	worker_study['logger'] = optimisation.Logger(pth_logs=pth_logs, uid='{}_{}'.format(uid, os.getpid()))
+	worker_study['contingency_data'] = contingency_data
+	optimisation.psse.InitialisePsspy().initialise_psse()
+	return None
+
+
+def run_study_case(i, contingency_procs=1, contingency_data=None, pth_logs=str(), uid=str()):
+	"""
+		Runs the contingency analysis for a single SAV case from the selector
+	:param int i:  Index of the SAV case / results file to study
+	:param int contingency_procs:  (optional=1) Number of processes to test the contingencies across
+	:param optimisation.file_handling.ImportContingencies contingency_data:  (optional=None) Contingencies already
+		imported, if not provided then those passed to the worker process are used
+	:param str pth_logs:  (optional=str()) Path where the log files for any contingency worker processes are stored
+	:param str uid:  (optional=str()) Unique identifier for the log files of any contingency worker processes
+	:return (str, str, bool, float), (pth_sav, pth_res, completed, duration):  Details of the study case and whether
+		the contingency analysis was completed
+	"""
+	logger = logging.getLogger(constants.Logging.logger_name)
+	t1 = time.time()
+	pth_sav = pth_EirGrid_SAV[i]
+	pth_res = pth_results[i]
+	logger.info('Processing SAV case {}'.format(pth_sav))
+	if contingency_data is None:
+		contingency_data = worker_study.get('contingency_data')
+	try:
+		_ = main(
+			cont_workbook=pth_Contingencies, psse_sav_case=pth_sav, target_workbook=pth_res,
+			pth_busbars=pth_busbar_list,
+			adjust_reactive=adjust_reactive_comp[i], n_procs=contingency_procs, contingency_data=contingency_data,
+			pth_logs=pth_logs, uid=uid
+		)
+		completed = True
+	except ValueError:
+		completed = False
+	finally:
+		# Ensure anything left from this SAV case is released before the next one is studied
+		gc.collect()
+
+	return pth_sav, pth_res, completed, time.time()-t1
+
+
 if __name__ == '__main__':
 	# Starting point
 	# Get time stamp for tracking progress
@@ -277,22 +511,38 @@ if __name__ == '__main__':
 	local_logger = log_cls.logger
 	local_logger.info('Study Started')
 
-	# Iterates through each of the SAV case / results files provided
-	for i in selector:
-		t1 = time.time()
-		pth_sav = pth_EirGrid_SAV[i]
-		pth_res = pth_results[i]
-		local_logger.info('Processing SAV case {}'.format(pth_sav))
-		try:
-			pth_excel = main(
-				cont_workbook=pth_Contingencies, psse_sav_case=pth_sav, target_workbook=pth_res,
-				pth_busbars=pth_busbar_list,
-				adjust_reactive=adjust_reactive_comp[i]
-			)
+	# Contingencies are the same for every SAV case and so are only imported once
+	local_logger.info('Importing details of all contingencies from workbook {}'.format(pth_Contingencies))
+	all_contingencies = optimisation.file_handling.ImportContingencies(pth=pth_Contingencies, use_cache=use_cache)
+
+	# If multiple SAV cases are selected then each is studied in its own process, the contingencies for each case are
+	# then tested in series since a worker process is not able to start its own pool of processes.
+	case_procs = min(len(selector), psse_licences, multiprocessing.cpu_count())
+	if case_procs > 1:
+		local_logger.info('Processing {} SAV cases across {} processes'.format(len(selector), case_procs))
+		case_pool = mp_context.Pool(
+			processes=case_procs, initializer=initialise_case_worker, initargs=(log_path, uid, all_contingencies)
+		)
+		case_results = case_pool.imap_unordered(run_study_case, selector)
+	else:
+		case_pool = None
+		case_results = (
+			run_study_case(
+				i, contingency_procs=n_procs, contingency_data=all_contingencies, pth_logs=log_path, uid=uid
+			) for i in selector
+		)
+
+	# Reports on each of the SAV case / results files provided as they are completed
+	for pth_sav, pth_res, study_completed, duration in case_results:
+		if study_completed:
 			local_logger.info(
-				'SAV case {} completed in {:.2f}, results saved in {}'.format(pth_sav, time.time()-t1, pth_res)
+				'SAV case {} completed in {:.2f}, results saved in {}'.format(pth_sav, duration, pth_res)
 			)
-		except ValueError:
+		else:
 			local_logger.error('Contingency analysis for the SAV case {} could not be completed'.format(pth_sav))
 
+	if case_pool is not None:
+		case_pool.close()
+		case_pool.join()
+
 	local_logger.info('Study completed in {:.2f} seconds'.format(time.time()-t0))
@@ -10,7 +10,9 @@
 #######################################################################################################################
 """
 
+import glob
 import os
+import sys
 import pandas as pd
 
 # Set to True to run in debug mode and therefore collect all output to window
@@ -34,6 +36,9 @@ class EirGridThresholds:
 		(250.0, 276.0): (250.0/275.0, 303.0/275.0),
 		(379.0, 401.0): (360.0/380.0, 410.0/380.0)
 	}
+	# Range of nominal voltages covered by the limits above, only busbars in this range are included in the subsystem
+	min_nominal = min(min(x) for x in steady_state_limits)
+	max_nominal = max(max(x) for x in steady_state_limits)
 
 	reactor_step_change_limit = 0.03
 	cont_step_change_limit = 0.1
@@ -84,8 +89,8 @@ class PSSE:
 	"""
 		Class to hold all of the constants associated with PSSE initialisation
 	"""
-	# default version = 33
-	version = 33
+	# default version = 35 (earlier versions of PSSE only provide Python 2.7 bindings)
+	version = 35
 
 	# Setting on whether PSSE should output results based on whether operating in DEBUG_MODE or not
 	output = {True: 1, False: 6}
@@ -117,15 +122,19 @@ class PSSE:
 			program_files_directory = r'C:\Program Files\PTI'
 
 		# TODO: Data checking of input version
+		# PSSE 35 ships a separate psspy folder for each supported Python version and so the one matching the running
+		# interpreter is used
 		psse_paths = {
-			32: 'PSSE32\PSSBIN',
-			33: 'PSSE33\PSSBIN',
-			34: 'PSSE34\PSSPY27'
+			32: r'PSSE32\PSSBIN',
+			33: r'PSSE33\PSSBIN',
+			34: r'PSSE34\PSSPY27',
+			35: r'PSSE35\PSSPY{}{}'.format(sys.version_info[0], sys.version_info[1])
 		}
 		os_paths = {
-			32: 'PSSE32\PSSBIN',
-			33: 'PSSE33\PSSBIN',
-			34: 'PSSE34\PSSBIN'
+			32: r'PSSE32\PSSBIN',
+			33: r'PSSE33\PSSBIN',
+			34: r'PSSE34\PSSBIN',
+			35: r'PSSE35\PSSBIN'
 		}
 		self.psse_py_path = os.path.join(program_files_directory, psse_paths[psse_version])
 		self.psse_os_path = os.path.join(program_files_directory, os_paths[psse_version])
@@ -133,8 +142,10 @@ class PSSE:
 
 	def find_psspy(self, start_directory=r'C:'):
 		"""
-			Function to search entire directory and find PSSE installation
-
+			Function to find the PSSE installation, the standard program files locations are checked first and only if
+			it is not found there is the entire directory searched
+		:param str start_directory: (optional=C:) - Directory to search if not found in the standard locations
+		:return (str, str), (self.psse_py_path, self.psse_os_path):
 		"""
 		# Clear variables
 		self.psse_py_path = str()
@@ -142,10 +153,28 @@ class PSSE:
 
 		psspy_to_find = "psspy.pyc"
 		psse_to_find = "psse.bat"
+
+		# Check the standard install locations, latest version is used if multiple are installed
+		program_files_directories = sorted(set(
+			os.environ.get(x, default) for x, default in (
+				('PROGRAMFILES', r'C:\Program Files'), ('PROGRAMFILES(X86)', r'C:\Program Files (x86)')
+			)
+		))
+		for program_files_directory in program_files_directories:
+			psspy_paths = sorted(glob.glob(os.path.join(program_files_directory, 'PTI', 'PSSE*', 'PSS*', psspy_to_find)))
+			psse_paths = sorted(glob.glob(os.path.join(program_files_directory, 'PTI', 'PSSE*', 'PSS*', psse_to_find)))
+			if psspy_paths and psse_paths:
+				self.psse_py_path = os.path.dirname(psspy_paths[-1])
+				self.psse_os_path = os.path.dirname(psse_paths[-1])
+				return self.psse_py_path, self.psse_os_path
+
 		for root, dirs, files in os.walk(start_directory):  # Walks through all subdirectories searching for file
+			# Hidden and system directories (e.g. $Recycle.Bin) are not searched
+			dirs[:] = [x for x in dirs if not x.startswith(('$', '.'))]
+
 			if psspy_to_find in files:
 				self.psse_py_path = root
-			elif psse_to_find in files:
+			if psse_to_find in files:
 				self.psse_os_path = root
 
 			if self.psse_py_path and self.psse_os_path:
@@ -169,6 +198,13 @@ class Contingency:
 	non_convergent_vstep = 'Non-Convergent Step Change'
 	non_convergent_vsteady = 'Non-Convergent Steady State'
 	error = 'ERROR'
+	# Message for each combination of convergence in the format {(convergent_v_step, convergent_v_steady): message}
+	convergence_messages = {
+		(False, False): non_convergent,
+		(True, True): convergent,
+		(False, True): non_convergent_vstep,
+		(True, False): non_convergent_vsteady
+	}
 
 	# Label used to identify all the contingencies by name
 	header = 'CONTINGENCY'
@@ -182,11 +218,10 @@ class Busbars:
 	state = 'TYPE'
 	nominal = 'BASE'
 	voltage = 'PU'
+	angle = 'ANGLED'
 	bus_name = 'EXNAME'
 
-	# Labels used for columns to determine voltage limits
-	nominal_lower = 'NOM_LOWER'
-	nominal_upper = 'NOM_UPPER'
+	# Labels used for columns containing the voltage limits
 	lower_limit = 'LOWER_LIMIT'
 	upper_limit = 'UPPER_LIMIT'
 
@@ -315,6 +350,12 @@ class Excel:
 
 	id = 'ID'
 
+	# Extension added to the contingencies workbook path for the cache of the imported contingencies
+	cache_extension = '.pkl'
+	# Version of the format of the imported contingencies, must be incremented whenever the import changes the
+	# contents of the DataFrames so that any existing cache files are no longer used
+	cache_version = 1
+
 	# This is the column names that will be applied and is irrelevant of what is already in the workboook
 	columns = {
 		circuit: [Contingency.header, Branches.from_bus, Branches.to_bus, Branches.id, Branches.status, comment],
@@ -330,6 +371,22 @@ class Excel:
 						 'bg_color': 'red'}
 	cell_format_change = {'bold': False,
 						 'bg_color': 'green'}
+	# Format for the header row and index column, matches that used by pandas when exporting to excel
+	cell_format_header = {'bold': True,
+						  'border': 1,
+						  'align': 'center',
+						  'valign': 'top'}
+
+	# Templates for the conditional formatting criteria, <cell> is the first cell in the data range
+	criteria_loading = '=and({cell}<>"",${ref_column}{row}>{threshold},{cell}>${ref_column}{row})'
+	criteria_voltage = '=and({cell}<>"", or({cell}<${ref_column1}{row}, {cell}>${ref_column2}{row}))'
+	criteria_voltage_step = '=and({cell}<>"",abs({ref_column}{row}-{cell})>{col}${ref_row})'
+	criteria_status = 'and({cell}<>"",{cell}<>${ref_column}{row})'
+
+	# Suffix added to the name of the temporary workbook that is written before replacing the target workbook
+	temp_suffix = '.tmp'
+	# Extension which results in the results being exported to a set of csv files rather than an excel workbook
+	csv_extension = '.csv'
 
 	def __init__(self):
 		pass
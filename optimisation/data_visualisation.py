@@ -11,12 +11,14 @@
 """
 
 
+import matplotlib
+# Figures are only saved to file and so non-interactive backend used which avoids any GUI toolkit overhead
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import matplotlib.cbook as cbook
-import collections
 from matplotlib.ticker import FormatStrFormatter
 import numpy as np
 import pandas as pd
+import multiprocessing
 import os
 import optimisation.file_handling as file_handling
 
@@ -79,28 +81,44 @@ def produce_plots_voltage(source_file, taps_locked=False):
 	else:
 		fig_name = file_name + '_Voltage.png'
 
-	# Columns and indexes in raw data that do not need to be considered in plot
-	cols_to_drop = ['NUMBER.1', 'EXNAME', col_nominal_voltage, col_basecase, col_lower_limit, col_upper_limit]
+	# Columns and indexes in raw data that do not need to be considered in plot, those which are never needed are not
+	# read from the results
+	cols_not_read = ('NUMBER.1', 'EXNAME')
+	cols_to_drop = [col_nominal_voltage, col_basecase, col_lower_limit, col_upper_limit]
 	index_to_drop = ['Compliant']
 
 	df_busbars, busbars_to_keep = file_handling.busbars_to_consider(pth_busbar_list=pth_busbar_list)
 
 	# Get results from contingency tool
-	df = pd.read_excel(source_file, sheet_name=sht, index_col=0)
+	df = pd.read_excel(source_file, sheet_name=sht, index_col=0, usecols=lambda x: x not in cols_not_read)
 	# Drop indexes that are no longer needed
 	df.drop(index=index_to_drop, inplace=True)
 
-	# Where based on a 380kV nominal adjust to be based on 400kV nominal
+	# Voltage limits for the step change results are taken from the steady state results, only the index and limit
+	# columns are read
 	if taps_locked:
-		df_steady = pd.read_excel(source_file, sheet_name=sht_steady, index_col=0)
+		header = pd.read_excel(source_file, sheet_name=sht_steady, nrows=0).columns
+		df_steady = pd.read_excel(
+			source_file, sheet_name=sht_steady, index_col=0,
+			usecols=[0, header.get_loc(col_lower_limit), header.get_loc(col_upper_limit)]
+		)
 		df[col_upper_limit] = df_steady.loc[:, col_upper_limit]
 		df[col_lower_limit] = df_steady.loc[:, col_lower_limit]
 
-	df.loc[df[col_nominal_voltage] == 380.0] = df[df.select_dtypes(include=['number']).columns] * (380.0/400.0)
-
-	for bus, contingency in df_busbars['Contingency'].iteritems():
-		if not pd.isna(contingency):
-			df.loc[bus, contingency] = np.nan
+	# Where based on a 380kV nominal adjust to be based on 400kV nominal, only the voltage and limit columns are scaled
+	num_cols = df.select_dtypes(include=[np.number]).columns.difference([col_nominal_voltage])
+	mask = df[col_nominal_voltage].to_numpy() == 380.0
+	df.loc[mask, num_cols] = df.loc[mask, num_cols].to_numpy() * (380.0/400.0)
+
+	# Busbars excluded for a contingency are removed from the results for that contingency, the positions of every
+	# busbar / contingency pair are found at once and blanked in a single masked update
+	excluded = df_busbars['Contingency'].dropna()
+	rows = df.index.get_indexer(excluded.index)
+	cols = df.columns.get_indexer(excluded.to_numpy())
+	found = (rows >= 0) & (cols >= 0)
+	mask = np.zeros(df.shape, dtype=bool)
+	mask[rows[found], cols[found]] = True
+	df = df.mask(mask)
 
 	# Extract voltage upper and lower threshold
 	thresholds = df.loc[:, [col_lower_limit, col_upper_limit]]
@@ -119,19 +137,20 @@ def produce_plots_voltage(source_file, taps_locked=False):
 	# X axis values
 	x2 = df.loc[busbars_to_keep, :].index
 
-	# Calculate box positions for boundary limits
-	stats = collections.OrderedDict()
-	for x in x2:
-		# noinspection PyUnresolvedReferences
-		stats[x] = cbook.boxplot_stats(thresholds.loc[x, :].values, labels=[x])[0]
-		stats[x]['q1'] = thresholds.loc[x, 'LOWER_LIMIT']
-		stats[x]['q3'] = thresholds.loc[x, 'UPPER_LIMIT']
+	# Calculate box positions for boundary limits, the box spans the lower to upper limit for each busbar
+	lower = thresholds.loc[x2, col_lower_limit].to_numpy(dtype=float)
+	upper = thresholds.loc[x2, col_upper_limit].to_numpy(dtype=float)
+	middle = (lower + upper) / 2.0
+	stats = [
+		{'label': x, 'mean': m, 'med': m, 'q1': l, 'q3': u, 'whislo': l, 'whishi': u, 'fliers': []}
+		for x, l, u, m in zip(x2, lower, upper, middle)
+	]
 
 	# #error_points = [1.0 for x in x_categories]
 
 	# Produce violin plot of busbar voltages
 	# Y axis values containing all busbar voltages for each contingency of selected busbars
-	y2 = df.loc[x2, :].T.values
+	y2 = df.loc[x2, :].to_numpy(dtype=float).T
 	vp = ax2.violinplot(y2, showmedians=False, showextrema=True, widths=c_violinwidth)
 	# Adjust violin plot colours
 	for pc in vp['bodies']:
@@ -141,7 +160,7 @@ def produce_plots_voltage(source_file, taps_locked=False):
 	vp['cmins'].set_linewidth(c_linewidth)
 
 	_ = ax2.bxp(
-		stats.values(), showcaps=False, medianprops={'linewidth': 0}, boxprops={'linewidth': c_linewidth},
+		stats, showcaps=False, medianprops={'linewidth': 0}, boxprops={'linewidth': c_linewidth},
 		whiskerprops={'linewidth': 0}, widths=c_boxplotwidth
 	)
 
@@ -166,12 +185,23 @@ def produce_plots_voltage(source_file, taps_locked=False):
 
 
 if __name__ == '__main__':
+	plot_jobs = list()
 	for i in selector:
 		res_file = source_files[i]
 
 		if os.path.isfile(res_file):
 			# Output run twice, once with taps locked and once with them in automatic mode
-			produce_plots_voltage(source_file=res_file, taps_locked=False)
-			produce_plots_voltage(source_file=res_file, taps_locked=True)
+			plot_jobs.append((res_file, False))
+			plot_jobs.append((res_file, True))
 		else:
 			print('File <{}> does not exist'.format(res_file))
+
+	# Rendering each figure at the required resolution is the slowest step and so each figure is produced in its own
+	# process
+	n_procs = min(len(plot_jobs), multiprocessing.cpu_count())
+	if n_procs > 1:
+		with multiprocessing.Pool(processes=n_procs) as pool:
+			pool.starmap(produce_plots_voltage, plot_jobs)
+	else:
+		for res_file, taps_locked in plot_jobs:
+			produce_plots_voltage(source_file=res_file, taps_locked=taps_locked)
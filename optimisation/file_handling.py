@@ -9,14 +9,20 @@
 #######################################################################################################################
 """
 
+import functools
 import logging
+import numbers
+import numpy as np
+import openpyxl
 import pandas as pd
 import os
-import string
+import pickle
+import xlsxwriter
 
 import optimisation.constants as constants
 
 
+@functools.lru_cache(maxsize=1024)
 def colnum_string(n):
 	string = ""
 	while n > 0:
@@ -25,22 +31,94 @@ def colnum_string(n):
 	return string
 
 
+# Value of each column letter (upper and lower case) used when converting a column string into a number
+column_letter_values = {chr(65 + i): i + 1 for i in range(26)}
+column_letter_values.update({c.lower(): v for c, v in column_letter_values.items()})
+
+
+@functools.lru_cache(maxsize=1024)
 def colstring_number(col):
 	num = 0
 	for c in col:
-		if c in string.ascii_letters:
-			num = num * 26 + (ord(c.upper()) - ord('A')) + 1
+		value = column_letter_values.get(c)
+		if value:
+			num = num * 26 + value
 	return num
 
 
+def sort_index(df):
+	"""
+		Function sorts the DataFrame by its index where the index contains both busbar numbers and labels
+		(i.e. Compliant), the numbers are sorted ahead of the labels so the labels remain at the end of the DataFrame
+	:param pd.DataFrame df: DataFrame to be sorted
+	:return pd.DataFrame df: Sorted DataFrame
+	"""
+	def key(x):
+		if isinstance(x, numbers.Number):
+			return 0, x, str()
+		return 1, 0, str(x)
+
+	index = df.index.tolist()
+	order = sorted(range(len(index)), key=lambda i: key(index[i]))
+	# No need to reorder the DataFrame if already sorted
+	if order == list(range(len(index))):
+		return df
+	return df.iloc[order]
+
+
+def sheet_to_df(wb, sheet_name, names):
+	"""
+		Function converts a worksheet from a workbook opened in read only mode into a DataFrame, the header row in the
+		worksheet is replaced by the names provided and any empty rows are skipped
+	:param openpyxl.Workbook wb: Workbook containing the worksheet
+	:param str sheet_name: Name of the worksheet to convert
+	:param list names: Column names for the DataFrame, any columns in the worksheet beyond these are ignored
+	:return pd.DataFrame df: DataFrame of the worksheet values
+	"""
+	# The header row is skipped and only the required columns are read, shorter rows are padded with None
+	rows = wb[sheet_name].iter_rows(min_row=2, max_col=len(names), values_only=True)
+
+	# Empty cells are populated with NaN in the same way as when read by pandas
+	data = [tuple(np.nan if x is None else x for x in row) for row in rows if any(x is not None for x in row)]
+	return pd.DataFrame(data=data, columns=names)
+
+
+def normalise_id(ids):
+	"""
+		Function converts any numeric IDs to strings without a decimal point (i.e. 1.0 becomes '1') so they can be
+		compared with the IDs in PSSE, IDs which have been entered as strings are retained as entered
+	:param pd.Series ids: IDs as imported from the workbook
+	:return pd.Series ids: IDs with all numeric values converted to strings
+	"""
+	# Where every ID has been entered as a number the whole column is converted without checking the type of each ID
+	if pd.api.types.is_numeric_dtype(ids) and not pd.api.types.is_bool_dtype(ids):
+		numeric = ids.notna()
+		ids = ids.astype(object)
+		ids[numeric] = ids[numeric].astype(float).round().astype(np.int64).astype(str)
+		return ids
+
+	ids = ids.astype(object)
+	numeric = ids.map(type).isin((int, float)) & ids.notna()
+	# Nothing to convert where all the IDs have been entered as strings
+	if not numeric.any():
+		return ids
+	ids[numeric] = ids[numeric].astype(float).round().astype(np.int64).astype(str)
+	return ids
+
+
 class ImportContingencies:
+	# Attributes which are stored in the cache file alongside the contingencies workbook
+	cached_attributes = ('circuits', 'tx2', 'tx3', 'busbars', 'fixed_shunts', 'switched_shunts', 'contingency_names')
 
-	def __init__(self, pth):
+	def __init__(self, pth, use_cache=False):
 		"""
 			Initialises the class and imports the complete set of contingencies
 			Contingencies are contained in an excel workbook split across a different worksheet to identify
 			circuits, transformers 2 winding, transformers 3 winding, busbars
 		:param str pth: Path to the file that needs importing
+		:param bool use_cache: (optional=False) - If True then the contingencies are loaded from a cache file alongside
+							the workbook if it is newer than the workbook and was created by the same version of the
+							import, otherwise the cache file is created
 		"""
 		self.circuits = pd.DataFrame()
 		self.tx2 = pd.DataFrame()
@@ -49,62 +127,114 @@ class ImportContingencies:
 		self.fixed_shunts = pd.DataFrame()
 		self.switched_shunts = pd.DataFrame()
 		self.contingency_names = set()
+		# Each of the contingency DataFrames split by contingency name in the format {attribute: {name: pd.DataFrame}}
+		self.by_name = dict()
 
 		self.pth = pth
+		self.pth_cache = '{}{}'.format(pth, constants.Excel.cache_extension)
 		self.c = constants.Excel
 
 		self.logger = logging.getLogger(constants.Logging.logger_name)
 
-		self.import_workbook()
+		if not use_cache or not self.load_cache():
+			self.import_workbook()
+			if use_cache:
+				self.save_cache()
+
+		self.split_by_name()
+
+	def split_by_name(self):
+		"""
+			Function splits each of the contingency DataFrames by contingency name so that the elements associated with
+			a single contingency can be looked up directly rather than searching the full DataFrames every time
+		:return None:
+		"""
+		column_header = constants.Contingency.header
+		self.by_name = {
+			attr: {name: df for name, df in getattr(self, attr).groupby(column_header, sort=False, observed=True)}
+			for attr in ('circuits', 'tx2', 'tx3', 'busbars', 'fixed_shunts', 'switched_shunts')
+		}
+		return None
+
+	def load_cache(self):
+		"""
+			Function to load the previously imported contingencies from the cache file if it is up to date
+		:return bool success:  True if the contingencies have been loaded from the cache file
+		"""
+		if not os.path.isfile(self.pth_cache) or os.path.getmtime(self.pth_cache) < os.path.getmtime(self.pth):
+			return False
+
+		try:
+			with open(self.pth_cache, 'rb') as f:
+				cache = pickle.load(f)
+		except Exception:
+			self.logger.warning('Unable to load contingencies cache {} and so workbook will be imported instead'
+								.format(self.pth_cache))
+			return False
+
+		# Cache files created by a different version of the import are ignored since the contents may differ
+		if not isinstance(cache, dict) or cache.get('version') != self.c.cache_version:
+			self.logger.debug('Contingencies cache {} is from a different version and so workbook will be imported'
+							  .format(self.pth_cache))
+			return False
+
+		for attr in self.cached_attributes:
+			setattr(self, attr, cache[attr])
+		self.logger.debug('Contingencies for workbook {} loaded from cache {}'.format(self.pth, self.pth_cache))
+		return True
+
+	def save_cache(self):
+		"""
+			Function to save the imported contingencies to the cache file so they can be quickly loaded next time
+		:return None:
+		"""
+		cache = {attr: getattr(self, attr) for attr in self.cached_attributes}
+		cache['version'] = self.c.cache_version
+		try:
+			with open(self.pth_cache, 'wb') as f:
+				pickle.dump(cache, f, pickle.HIGHEST_PROTOCOL)
+		except (OSError, IOError):
+			self.logger.warning('Unable to save contingencies cache {}, the workbook will be imported again next time'
+								.format(self.pth_cache))
+		return None
 
 	def import_workbook(self):
 		"""
 			Function to import the workbook and deal with all the processing
 		:return:
 		"""
-		# xl = pd.ExcelFile(self.pth)
-		# Get circuit contingencies
-		self.circuits = pd.read_excel(
-			self.pth, sheet_name=self.c.circuit, header=0,
-			names=self.c.columns[self.c.circuit]
-		)
-		self.circuits[self.c.id] = self.circuits[self.c.id].apply(lambda x: '{0:.0f}'.format(x) if isinstance(x, float) else x)
-
-		# Get 2 winding transformer contingencies
-		self.tx2 = pd.read_excel(self.pth, sheet_name=self.c.tx2, header=0,
-								 names=self.c.columns[self.c.tx2])
-		self.tx2[self.c.id] = self.tx2[self.c.id].apply(lambda x: '{0:.0f}'.format(x) if isinstance(x, float) else x)
-
-		# Get 3 winding transformer contingencies
-		self.tx3 = pd.read_excel(self.pth, sheet_name=self.c.tx3, header=0,
-								 names=self.c.columns[self.c.tx3])
-		self.tx3[self.c.id] = self.tx3[self.c.id].apply(lambda x: '{0:.0f}'.format(x) if isinstance(x, float) else x)
-
-		# Get busbar contingencies
-		self.busbars = pd.read_excel(self.pth, sheet_name=self.c.busbars, header=0,
-									 names=self.c.columns[self.c.busbars])
-
-		# Get shunt contingencies
-		self.fixed_shunts = pd.read_excel(self.pth, sheet_name=self.c.fixed_shunts, header=0,
-										  names=self.c.columns[self.c.fixed_shunts])
-		self.fixed_shunts[self.c.id] = self.fixed_shunts[self.c.id].apply(lambda x: '{0:.0f}'.format(x) if isinstance(x, float) else x)
-
-		self.switched_shunts = pd.read_excel(self.pth, sheet_name=self.c.switched_shunts, header=0,
-											 names=self.c.columns[self.c.switched_shunts])
-		self.switched_shunts[self.c.id] = self.switched_shunts[self.c.id].apply(lambda x: '{0:.0f}'.format(x) if isinstance(x, float) else x)
-
-		# Extract unique list of all contingencies being considered
-		all_cont_names = [x[constants.Contingency.header] for x in [
-			self.circuits,
-			self.tx2,
-			self.tx3,
-			self.busbars,
-			self.fixed_shunts,
-			self.switched_shunts
-		]]
-
-		# Combine into a single series and then extract using set to drop duplicates sorted into alphabetic order
-		self.contingency_names = sorted(set(pd.concat(all_cont_names)))
+		# Workbook is opened once in read only mode so the values are streamed without loading any of the formatting
+		wb = openpyxl.load_workbook(self.pth, read_only=True, data_only=True)
+		try:
+			# Get circuit, 2 winding transformer, 3 winding transformer, busbar and shunt contingencies
+			self.circuits = sheet_to_df(wb=wb, sheet_name=self.c.circuit, names=self.c.columns[self.c.circuit])
+			self.tx2 = sheet_to_df(wb=wb, sheet_name=self.c.tx2, names=self.c.columns[self.c.tx2])
+			self.tx3 = sheet_to_df(wb=wb, sheet_name=self.c.tx3, names=self.c.columns[self.c.tx3])
+			self.busbars = sheet_to_df(wb=wb, sheet_name=self.c.busbars, names=self.c.columns[self.c.busbars])
+			self.fixed_shunts = sheet_to_df(
+				wb=wb, sheet_name=self.c.fixed_shunts, names=self.c.columns[self.c.fixed_shunts]
+			)
+			self.switched_shunts = sheet_to_df(
+				wb=wb, sheet_name=self.c.switched_shunts, names=self.c.columns[self.c.switched_shunts]
+			)
+		finally:
+			# Workbooks opened in read only mode keep the file open until closed
+			wb.close()
+
+		# IDs are converted to strings for every type of contingency except busbars which do not have an ID
+		for df in (self.circuits, self.tx2, self.tx3, self.fixed_shunts, self.switched_shunts):
+			df[self.c.id] = normalise_id(ids=df[self.c.id])
+
+		# Contingency names are repeated for every element in a contingency and so are stored as categoricals, this
+		# means comparisons and grouping by name work on integer codes rather than python strings
+		dfs = (self.circuits, self.tx2, self.tx3, self.busbars, self.fixed_shunts, self.switched_shunts)
+		for df in dfs:
+			df[constants.Contingency.header] = df[constants.Contingency.header].astype('category')
+
+		# Extract unique list of all contingencies being considered sorted into alphabetic order, the categories of each
+		# contingency name column are already the unique names for that DataFrame
+		contingency_names = [df[constants.Contingency.header].cat.categories.to_numpy(dtype=object) for df in dfs]
+		self.contingency_names = np.unique(np.concatenate(contingency_names)).tolist()
 
 		if not self.contingency_names:
 			self.logger.error(('The contingencies workbook: {} is empty and therefore there'
@@ -119,14 +249,13 @@ class ImportContingencies:
 		:return (pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()),
 				(circuit_data, tx2_data, tx3_data, busbar_data):
 		"""
-		column_header = constants.Contingency.header
-
-		circuit_data = self.circuits[self.circuits[column_header] == cont_name]
-		tx2_data = self.tx2[self.tx2[column_header] == cont_name]
-		tx3_data = self.tx3[self.tx3[column_header] == cont_name]
-		busbars = self.busbars[self.busbars[column_header] == cont_name]
-		fixed_shunts = self.fixed_shunts[self.fixed_shunts[column_header] == cont_name]
-		switched_shunts = self.switched_shunts[self.switched_shunts[column_header] == cont_name]
+		# Where there are no elements of a type for this contingency an empty DataFrame with the same columns is returned
+		circuit_data = self.by_name['circuits'].get(cont_name, self.circuits.iloc[0:0])
+		tx2_data = self.by_name['tx2'].get(cont_name, self.tx2.iloc[0:0])
+		tx3_data = self.by_name['tx3'].get(cont_name, self.tx3.iloc[0:0])
+		busbars = self.by_name['busbars'].get(cont_name, self.busbars.iloc[0:0])
+		fixed_shunts = self.by_name['fixed_shunts'].get(cont_name, self.fixed_shunts.iloc[0:0])
+		switched_shunts = self.by_name['switched_shunts'].get(cont_name, self.switched_shunts.iloc[0:0])
 
 		return circuit_data, tx2_data, tx3_data, busbars, fixed_shunts, switched_shunts
 
@@ -136,52 +265,187 @@ class ExportResults:
 		Class to deal with the processing and exporting of results to excel
 	"""
 
-	def __init__(self, pth_workbook, results, convergence):
+	def __init__(self, pth_workbook, results, convergence, include_transposed=True, already_sorted=False):
 		"""
 			Initialise
 		:param str pth_workbook: Full path for workbook to be exported
-		:param collections.OrderedDict results: Dictionary in the format {sheet:pd.DataFrame} of results to be exported
+		:param dict results: Dictionary in the format {sheet:pd.DataFrame} of results to be exported
 		:param pd.DataFrame convergence: Dictionary in the format {contingency:(message, convergence)} of results to be exported
+		:param bool include_transposed: (optional=True) - If True then a transposed copy of each of the results is
+							also written to the workbook
+		:param bool already_sorted: (optional=False) - If True then the results are already sorted by busbar / element
+							and so are not sorted again before being written
 		"""
 
 		self.logger = logging.getLogger(constants.Logging.logger_name)
 		self.pth = pth_workbook
+		self.include_transposed = include_transposed
+		self.already_sorted = already_sorted
+		# Formats that have been added to the workbook, keyed by their specification
+		self.formats = dict()
 
 		if os.path.exists(self.pth):
 			self.logger.info('Target workbook path {} already exists and will be overwritten'.format(self.pth))
-			try:
-				os.remove(self.pth)
-			except WindowsError:
-				self.logger.critical('Unable to overwrite file {} since it is currently being used, please close'
-									 .format(self.pth))
-				raise WindowsError('The process cannot access the file because it is being used by another process: {}'
-								   .format(self.pth))
-
-		# Write all data to same workbook on different sheets
-		with pd.ExcelWriter(path=self.pth, engine='xlsxwriter') as excel_writer:
+
+		# Results exported to csv files if no excel formatting is required
+		if self.pth.endswith(constants.Excel.csv_extension):
+			self.export_csv(results=results, convergence=convergence)
+			return
+
+		# Workbook is written to a temporary file alongside the target and then moved into place so that an existing
+		# workbook is only replaced once the new one is complete
+		root, ext = os.path.splitext(self.pth)
+		pth_temp = '{}{}{}'.format(root, constants.Excel.temp_suffix, ext)
+		try:
+			self.export_workbook(pth_workbook=pth_temp, results=results, convergence=convergence)
+		except Exception:
+			if os.path.exists(pth_temp):
+				os.remove(pth_temp)
+			raise
+
+		try:
+			os.replace(pth_temp, self.pth)
+		except PermissionError:
+			os.remove(pth_temp)
+			self.logger.critical('Unable to overwrite file {} since it is currently being used, please close'
+								 .format(self.pth))
+			raise PermissionError('The process cannot access the file because it is being used by another process: {}'
+								  .format(self.pth))
+
+	def export_workbook(self, pth_workbook, results, convergence):
+		"""
+			Function writes the convergence and each of the results to a separate sheet of an excel workbook
+		:param str pth_workbook: Full path for workbook to be written
+		:param dict results: Dictionary in the format {sheet:pd.DataFrame} of results to be exported
+		:param pd.DataFrame convergence: DataFrame of the convergence and compliance results
+		:return None:
+		"""
+		# Write all data to same workbook on different sheets, constant memory mode flushes each row to disk once it has
+		# been written and so requires that the rows are written in order
+		book = xlsxwriter.Workbook(pth_workbook, {'constant_memory': True})
+		try:
 			# Set format for conditional formatting
-			book = excel_writer.book
-			format_error = book.add_format(constants.Excel.cell_format_error)
-			format_change = book.add_format(constants.Excel.cell_format_change)
+			format_error = self.get_format(book=book, spec=constants.Excel.cell_format_error)
+			format_change = self.get_format(book=book, spec=constants.Excel.cell_format_change)
+			format_header = self.get_format(book=book, spec=constants.Excel.cell_format_header)
 
 			# Write convergence DataFrame
-			convergence.to_excel(excel_writer, sheet_name=constants.Excel.convergence)
-
-			for sht, df in results.iteritems():
-				df.sort_index(axis=0, ascending=True, inplace=True)
-				df.to_excel(excel_writer, sheet_name=sht)
+			self.write_sheet(book=book, sht=constants.Excel.convergence, df=convergence, cell_format=format_header)
+
+			for sht, df in results.items():
+				# Empty results are written as an empty sheet without sorting, formatting or a transposed copy
+				if df.empty:
+					self.write_sheet(book=book, sht=sht, df=df, cell_format=format_header)
+					continue
+
+				if not self.already_sorted:
+					df = sort_index(df)
+
+				# Get conditional formatting, this is registered with the worksheet before any of the rows are streamed
+				# to it
+				conditional_formatting = None
+				data_range, criteria = self.get_conditional_formatting(
+					df=df, cell_format_error=format_error, cell_format_change=format_change
+				)
+				if data_range:
+					conditional_formatting = (data_range, criteria)
+
+				self.write_sheet(
+					book=book, sht=sht, df=df, cell_format=format_header, conditional_formatting=conditional_formatting
+				)
 				# Also writes copy of data in transposed state so can filter for non-compliance
 				# Does not include conditional formatting
-				df.T.to_excel(excel_writer, sheet_name='{}_T'.format(sht))
+				if self.include_transposed:
+					self.write_sheet(book=book, sht='{}_T'.format(sht), df=df, cell_format=format_header, transpose=True)
+		finally:
+			book.close()
+		return None
+
+	def get_format(self, book, spec):
+		"""
+			Function returns the format for the provided specification, formats are only added to the workbook once
+			so that the same specification used for different criteria or sheets shares a single format
+		:param xlsxwriter.Workbook book: Workbook the format belongs to
+		:param dict spec: Format properties as passed to xlsxwriter.Workbook.add_format
+		:return xlsxwriter.format cell_format: Format for the specification
+		"""
+		key = tuple(sorted(spec.items()))
+		if key not in self.formats:
+			self.formats[key] = book.add_format(spec)
+		return self.formats[key]
 
-				# Get conditional formatting when DataFrame isn't empty
-				if not df.empty:
-					data_range, criteria = self.get_conditional_formatting(
-						df=df, cell_format_error=format_error, cell_format_change=format_change
-					)
-					if data_range:
-						worksheet = excel_writer.sheets[sht]
-						worksheet.conditional_format(data_range, criteria)
+	@staticmethod
+	def write_sheet(book, sht, df, cell_format, conditional_formatting=None, transpose=False):
+		"""
+			Function writes the DataFrame to a new worksheet row by row with the same layout as pd.DataFrame.to_excel
+		:param xlsxwriter.Workbook book: Workbook to add the worksheet to
+		:param str sht: Name of the worksheet
+		:param pd.DataFrame df: DataFrame to be written
+		:param xlsxwriter.format cell_format: Format to use for the header row and index column
+		:param tuple conditional_formatting: (optional=None) - Conditional formatting to add to the worksheet in the
+							format (data_range, criteria) as returned by <get_conditional_formatting>
+		:param bool transpose: (optional=False) - If True then the DataFrame is written transposed, each column is
+							written as a row so that a transposed copy of the DataFrame is never created
+		:return xlsxwriter.worksheet worksheet: Worksheet that has been written
+		"""
+		worksheet = book.add_worksheet(sht)
+		if conditional_formatting is not None:
+			worksheet.conditional_format(*conditional_formatting)
+
+		# Labels which are not a single value are written as a string
+		def label(x):
+			return str(x) if isinstance(x, tuple) else x
+
+		if transpose:
+			index_name, header, labels = df.columns.name, df.index, df.columns
+		else:
+			index_name, header, labels = df.index.name, df.columns, df.index
+
+		# Header row includes the index name
+		worksheet.write(0, 0, label(index_name), cell_format)
+		worksheet.write_row(0, 1, [label(x) for x in header.tolist()], cell_format)
+
+		# Sheets which only contain numbers are written directly as numbers from a single float array which avoids the
+		# type checking of every value, empty cells are skipped rather than written as NaN
+		numeric = all(
+			pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype) for dtype in df.dtypes
+		)
+		if numeric:
+			values = df.to_numpy(dtype=float)
+			for row, (idx, data) in enumerate(zip(labels.tolist(), (values.T if transpose else values).tolist()), 1):
+				worksheet.write(row, 0, label(idx), cell_format)
+				for col, value in enumerate(data, start=1):
+					if value == value:
+						worksheet.write_number(row, col, value)
+			return worksheet
+
+		# Empty cells are written as blanks rather than NaN, the values are converted once for the whole DataFrame and
+		# for the transposed copy the columns are read from a transposed view of the same array
+		values = df.astype(object).where(df.notna(), None).to_numpy()
+		if transpose:
+			values = values.T
+
+		for row, (idx, data) in enumerate(zip(labels.tolist(), values), start=1):
+			worksheet.write(row, 0, label(idx), cell_format)
+			worksheet.write_row(row, 1, data.tolist())
+
+		return worksheet
+
+	def export_csv(self, results, convergence):
+		"""
+			Function exports the convergence and each of the results to a separate csv file named after the sheet
+			that would have been used in the excel workbook, no formatting or transposed copies are included
+		:param dict results: Dictionary in the format {sheet:pd.DataFrame} of results to be exported
+		:param pd.DataFrame convergence: DataFrame of the convergence and compliance results
+		:return None:
+		"""
+		root, ext = os.path.splitext(self.pth)
+		convergence.to_csv('{}_{}{}'.format(root, constants.Excel.convergence, ext))
+		for sht, df in results.items():
+			if not self.already_sorted:
+				df = sort_index(df)
+			df.to_csv('{}_{}{}'.format(root, sht, ext))
+		return None
 
 	def get_conditional_formatting(self, df, cell_format_error, cell_format_change):
 		"""
@@ -190,55 +454,60 @@ class ExportResults:
 		:param xlsxwriter.format cell_format: format class to be used for the conditional formatting
 		:return tuple conditional_formatting:
 		"""
+		# Positions of all the columns that may be referenced are looked up together, -1 if not in the DataFrame
+		keys = (
+			constants.Contingency.bc, constants.Contingency.rate_for_checking,
+			constants.Busbars.lower_limit, constants.Busbars.upper_limit
+		)
+		positions = dict(zip(keys, df.columns.get_indexer_for(keys)))
+
 		# Get the start column
-		start_col = colnum_string(df.columns.get_loc(constants.Contingency.bc) + 2)
+		start_col = colnum_string(positions[constants.Contingency.bc] + 2)
 		end_col = colnum_string(len(df.columns) + 1)
 		start_row = df.columns.nlevels + 1
 		end_row = len(df.index)
 
+		# Reference to the first cell in the data range which the criteria are relative to
+		first_cell = '{}{}'.format(start_col, start_row)
+
 		# Determine reference column
-		if constants.Contingency.rate_for_checking in df.columns:
+		if positions[constants.Contingency.rate_for_checking] >= 0:
 			# Circuit loading
-			ref_column = colnum_string(df.columns.get_loc(constants.Contingency.rate_for_checking) + 2)
-			criteria = '=and({}{}<>"",${}{}>{},{}{}>${}{})'.format(
-				start_col, start_row,
-				ref_column, start_row, constants.EirGridThresholds.rating_threshold,
-				start_col, start_row, ref_column, start_row
+			ref_column = colnum_string(positions[constants.Contingency.rate_for_checking] + 2)
+			criteria = constants.Excel.criteria_loading.format(
+				cell=first_cell, ref_column=ref_column, row=start_row,
+				threshold=constants.EirGridThresholds.rating_threshold
 			)
 			# Select the required cell formatting for this type of conditional formatting
 			selected_format = cell_format_error
-		elif constants.Busbars.lower_limit in df.columns:
+		elif positions[constants.Busbars.lower_limit] >= 0:
 			# Voltage range checking
-			ref_column1 = colnum_string(df.columns.get_loc(constants.Busbars.lower_limit) + 2)
-			ref_column2 = colnum_string(df.columns.get_loc(constants.Busbars.upper_limit) + 2)
-			criteria = '=and({}{}<>"", or({}{}<${}{}, {}{}>${}{}))'.format(
-				start_col, start_row,
-				start_col, start_row, ref_column1, start_row,
-				start_col, start_row, ref_column2, start_row
+			ref_column1 = colnum_string(positions[constants.Busbars.lower_limit] + 2)
+			ref_column2 = colnum_string(positions[constants.Busbars.upper_limit] + 2)
+			criteria = constants.Excel.criteria_voltage.format(
+				cell=first_cell, ref_column1=ref_column1, ref_column2=ref_column2, row=start_row
 			)
 			# Select the required cell formatting for this type of conditional formatting
 			selected_format = cell_format_error
 		elif constants.Contingency.v_step_lbl in df.index:
 			# No need to include the BASE CASE so move 1 column along
 			start_col = colnum_string(colstring_number(start_col) + 1)
+			first_cell = '{}{}'.format(start_col, start_row)
 			# Voltage step limit check
 			ref_row = df.index.get_loc(constants.Contingency.v_step_lbl) + 2
-			ref_column = colnum_string(df.columns.get_loc(constants.Contingency.bc) + 2)
+			ref_column = colnum_string(positions[constants.Contingency.bc] + 2)
 			# Updated to include the step-change voltage in the export and calculate the step-change value when using
 			# conditional formatting
-			criteria = '=and({}{}<>"",abs({}{}-{}{})>{}${})'.format(
-				start_col, start_row,
-				ref_column, start_row, start_col, start_row, start_col, ref_row
+			criteria = constants.Excel.criteria_voltage_step.format(
+				cell=first_cell, ref_column=ref_column, row=start_row, col=start_col, ref_row=ref_row
 			)
 			# Select the required cell formatting for this type of conditional formatting
 			selected_format = cell_format_error
 			end_row = ref_row - 2
 		else:
 			# The remainder relate to status changes
-			ref_column = colnum_string(df.columns.get_loc(constants.Contingency.bc) + 2)
-			criteria = 'and({}{}<>"",{}{}<>${}{})'.format(
-				start_col, start_row,
-				start_col, start_row, ref_column, start_row)
+			ref_column = colnum_string(positions[constants.Contingency.bc] + 2)
+			criteria = constants.Excel.criteria_status.format(cell=first_cell, ref_column=ref_column, row=start_row)
 			# Select the required cell formatting for this type of conditional formatting
 			selected_format = cell_format_change
 			end_row = len(df.index) + 1
@@ -260,8 +529,16 @@ def busbars_to_consider(pth_busbar_list):
 	:return:
 	"""
 
+	# Only the busbar number (first column) and the columns which are used for selecting, sorting and labelling the
+	# busbars are read from what may be a wide sheet
+	cols_to_read = ('Include', 'Nominal', 'Plot Name', 'Contingency')
+	header = pd.read_excel(pth_busbar_list, sheet_name='Busbars', nrows=0).columns
+	usecols = [0] + [header.get_loc(col) for col in cols_to_read if col in header]
+
 	# Get list of busbars to be plotted
-	df_busbars = pd.read_excel(pth_busbar_list, sheet_name='Busbars', index_col=0, header=0)
+	df_busbars = pd.read_excel(
+		pth_busbar_list, sheet_name='Busbars', index_col=0, header=0, usecols=usecols, dtype={'Nominal': float}
+	)
 
 	# Reduce dataframe to only be those which are labelled as keep
 	df_busbars = df_busbars.loc[df_busbars['Include'] == 1]
@@ -16,6 +16,8 @@ import optimisation.constants as constants
 import sys
 import os
 import logging
+import tempfile
+import functools
 import numpy as np
 import pandas as pd
 
@@ -28,7 +30,7 @@ class InitialisePsspy:
 	def __init__(self, psse_version=constants.PSSE.version):
 		"""
 			Intialises the paths and checks that import psspy works
-		:param int psse_version: (optional=34)
+		:param int psse_version: (optional=constants.PSSE.version)
 		"""
 
 		self.psse = False
@@ -45,6 +47,10 @@ class InitialisePsspy:
 		if self.psse_py_path not in os.environ['PATH']:
 			os.environ['PATH'] += ';{}'.format(self.psse_py_path)
 
+		# From Python 3.8 the PATH is no longer searched for the DLLs that psspy depends on
+		if hasattr(os, 'add_dll_directory') and os.path.isdir(self.psse_os_path):
+			os.add_dll_directory(self.psse_os_path)
+
 		global psspy
 		global pssarrays
 		try:
@@ -107,6 +113,8 @@ class BranchData:
 		# Initialise empty variables
 		self.df_status = pd.DataFrame()
 		self.df_loading = pd.DataFrame()
+		# Original status of each branch keyed by (from busbar, to busbar, ID)
+		self.status_by_key = dict()
 
 		# constants
 		self.logger = logging.getLogger(constants.Logging.logger_name)
@@ -138,6 +146,11 @@ class BranchData:
 		self.flag = flag
 		self.sid = sid
 
+		# Functions for retrieving data from PSSE
+		self.func_int = psspy.abrnint
+		self.func_char = psspy.abrnchar
+		self.func_real = psspy.abrnreal
+
 		# Update DataFrame from PSSE case
 		self.update()
 
@@ -146,15 +159,33 @@ class BranchData:
 			Updates data from SAV case
 		:param str cont_name:  Contingency name for these results
 		"""
-		# Declare functions
-		func_int = psspy.abrnint
-		func_char = psspy.abrnchar
-		func_real = psspy.abrnreal
+		# Functions bound once when the class is initialised
+		func_int = self.func_int
+		func_char = self.func_char
+		func_real = self.func_real
 
 		# Function input constants
 		entry = 2  # Double entry
 		ties = 3 # Include interior and exterior branches
 
+		# For a contingency only the status and loading are recorded, the busbars, IDs and ratings are unchanged from
+		# the base case and so are not retrieved from PSSE again
+		if cont_name is not None:
+			ierr_int, iarray = func_int(sid=self.sid, flag=self.flag, entry=entry, ties=ties, string=(self.c.status,))
+			ierr_real, rarray = func_real(
+				sid=self.sid, flag=self.flag, entry=entry, ties=ties, string=(self.c.loading,)
+			)
+			if ierr_int > 0 or ierr_real > 0:
+				self.logger.error(('Unable to retrieve the branch data from the SAV case and the following error codes '
+								   'were returned: {} and {} from functions <{}> and <{}>')
+								  .format(ierr_int, ierr_real, func_int.__name__, func_real.__name__))
+				raise ValueError('Error importing data from PSSE SAV case')
+
+			# Add new column to DataFrame with the status and loading of the circuit during this contingency
+			self.df_status[cont_name] = np.array(iarray[0], dtype=np.int8)
+			self.df_loading[cont_name] = np.array(rarray[0], dtype=object)
+			return None
+
 		# Retrieve data from PSSE
 		ierr_int, iarray = func_int(
 			sid=self.sid,
@@ -183,6 +214,10 @@ class BranchData:
 									  func_int.__name__, func_char.__name__, func_real.__name__))
 			raise ValueError('Error importing data from PSSE SAV case')
 
+		# Remove empty string in ID column (PSSE will return '1' as '1 ' but will accept '1' as an input), stripped as a
+		# list before the DataFrame is created
+		carray[0] = [x.strip() for x in carray[0]]
+
 		# Combine data into single list of lists
 		# Populate the complete DataFrame, overwriting any new values
 		data = iarray + carray + rarray
@@ -190,35 +225,56 @@ class BranchData:
 		# in case needed
 		initial_columns = [self.c.from_bus, self.c.to_bus, self.c.status, self.c.id,
 						   self.c.ratea, self.c.rateb, self.c.ratec, self.c.loading]
-		# Transposed so columns in correct location and then columns reordered to something more suitable
-		complete_df = pd.DataFrame(data).transpose()
-		complete_df.columns = initial_columns
-		# Remove empty string in ID column (PSSE will return '1' as '1 ' but will accept '1' as an input
-		complete_df[self.c.id] = complete_df[self.c.id].str.strip()
-
-		if cont_name is None:
-			# Extract data for status of branch
-			columns_for_status = [self.c.from_bus, self.c.to_bus, self.c.id, self.c.status]
-			self.df_status = complete_df[columns_for_status]
-			# Add column for base case
-			self.df_status[constants.Contingency.bc] = self.df_status[self.c.status]
-
-			# Extract data for the circuit loading and specified ratings
-			columns_for_rating = [self.c.from_bus, self.c.to_bus, self.c.id, self.c.ratea, self.c.rateb,
-								  self.c.ratec, self.c.loading]
-			self.df_loading = complete_df[columns_for_rating]
-			# Add column for base case
-			self.df_loading[constants.Contingency.bc] = self.df_loading[self.c.loading]
+		# Built column by column from the lists returned by PSSE so no transposed copy is needed, columns are kept as
+		# objects so that the compliance labels can later be added to the same columns
+		complete_df = pd.DataFrame(data=dict(zip(initial_columns, data)), dtype=object)
+		# Ratings never have labels added and so are stored as floats to be compared without any conversion
+		rating_columns = [self.c.ratea, self.c.rateb, self.c.ratec]
+		complete_df[rating_columns] = complete_df[rating_columns].astype(np.float64)
+		# IDs are repeated across many branches and so are stored as categoricals
+		complete_df[self.c.id] = complete_df[self.c.id].astype('category')
+
+		# Extract data for status of branch
+		columns_for_status = [self.c.from_bus, self.c.to_bus, self.c.id, self.c.status]
+		self.df_status = complete_df[columns_for_status].copy(deep=False)
+		# Add column for base case, no compliance row is added to the status results and so the status of each study
+		# is stored as a compact integer column rather than as objects
+		self.df_status[constants.Contingency.bc] = self.df_status[self.c.status].to_numpy(dtype=np.int8)
+		# Original status of each branch so it can be looked up directly when restoring a branch
+		self.status_by_key = dict(zip(
+			zip(complete_df[self.c.from_bus].tolist(), complete_df[self.c.to_bus].tolist(),
+				complete_df[self.c.id].tolist()),
+			complete_df[self.c.status].tolist()
+		))
+
+		# Extract data for the circuit loading and specified ratings
+		columns_for_rating = [self.c.from_bus, self.c.to_bus, self.c.id, self.c.ratea, self.c.rateb,
+							  self.c.ratec, self.c.loading]
+		self.df_loading = complete_df[columns_for_rating].copy(deep=False)
+		# Add column for base case
+		self.df_loading[constants.Contingency.bc] = self.df_loading[self.c.loading].to_numpy()
+		return None
 
-		else:
-			# Add new column to DataFrame with the status of the circuit during this contingency
-			self.df_status[cont_name] = complete_df[self.c.status]
-			self.df_loading[cont_name] = complete_df[self.c.loading]
+	def get_status(self):
+		"""
+			Returns the current status of every branch in the PSSE case, in the same order as <df_status>
+		:return np.ndarray status:  Array of the branch status values
+		"""
+		func_int = self.func_int
+		# Same double entry and tie inputs as used to populate <df_status>
+		ierr_int, iarray = func_int(sid=self.sid, flag=self.flag, entry=2, ties=3, string=(self.c.status,))
+		if ierr_int > 0:
+			self.logger.error(('Unable to retrieve the branch status from the SAV case and the following error code '
+							   'was returned: {} from function <{}>')
+							  .format(ierr_int, func_int.__name__))
+			raise ValueError('Error importing data from PSSE SAV case')
+
+		return np.asarray(iarray[0])
 
 	def change_state(self, asset=pd.Series(), restore=False, restore_all=False):
 		"""
 			Switches the status of the branch for a specific contingency and updates the branch status
-		:param pd.Series asset: (optional=pd.Series()) Branch whose status is to be changed
+		:param pd.Series / dict asset: (optional=pd.Series()) Branch whose status is to be changed
 		:param bool restore: (optional=False) - if set to True then will restore single branch back to original value
 		:param bool restore_all: (optional=False) - if set to True then will restore every branch back to original value
 		:return bool success: Whether successfully switched circuit or not
@@ -229,17 +285,26 @@ class BranchData:
 		success = False
 
 		if restore_all:
-			# Loop through and restore every asset to its original status
-			for i, row in self.df_status.iterrows():
-				# TODO: This may be quite slow so could be useful to find out current status and only switch those
-				# TODO: which are actually different
-
-				# TODO: Currently will loop through every asset since they are duplicated in direction, should detect this
-				bus1 = row[self.c.from_bus]
-				bus2 = row[self.c.to_bus]
-				ckt = row[self.c.id]
-				status = row[self.c.status]
-				success = self.switch(bus1, bus2, ckt, status)
+			# Nothing to restore if there are no assets of this type
+			if self.df_status.empty:
+				return success
+			# Only those assets where the current status in PSSE differs from the original status are restored, the
+			# columns are extracted as arrays once rather than creating a series for every row
+			buses1 = self.df_status[self.c.from_bus].to_numpy()
+			buses2 = self.df_status[self.c.to_bus].to_numpy()
+			ckts = self.df_status[self.c.id].to_numpy()
+			statuses = self.df_status[self.c.status].to_numpy()
+			changed = np.flatnonzero(self.get_status() != statuses)
+
+			# Each branch is listed once in each direction and so is only switched for the first direction found
+			switched = set()
+			success = True
+			for k in changed:
+				key = (min(buses1[k], buses2[k]), max(buses1[k], buses2[k]), ckts[k])
+				if key in switched:
+					continue
+				switched.add(key)
+				success = self.switch(buses1[k], buses2[k], ckts[k], statuses[k]) and success
 
 		else:
 			bus1 = asset[self.c.from_bus]
@@ -247,11 +312,7 @@ class BranchData:
 			ckt = asset[self.c.id]
 			if restore:
 				# Get original status value
-				status = self.df_status.loc[
-					(self.df_status[self.c.from_bus] == bus1) &
-					(self.df_status[self.c.to_bus] == bus2) &
-					(self.df_status[self.c.id] == ckt),
-					self.c.status].item()
+				status = self.status_by_key[(bus1, bus2, ckt)]
 			else:
 				status = asset[self.c.status]
 
@@ -300,10 +361,11 @@ class BranchData:
 								validation
 		:return None:
 		"""
-		# Get list of transformers which do not have any winding data
-		items_with_no_rating = self.df_loading[self.df_loading[constants.Contingency.rate_for_checking] <=
-											   constants.EirGridThresholds.rating_threshold]
-		if not items_with_no_rating.empty:
+		# Get list of items which do not have a rating, only reported when there are any
+		rating = self.df_loading[constants.Contingency.rate_for_checking].to_numpy()
+		no_rating = rating <= constants.EirGridThresholds.rating_threshold
+		if no_rating.any():
+			items_with_no_rating = self.df_loading.iloc[np.flatnonzero(no_rating)]
 			if self.tx:
 				asset = '2 winding transformer'
 			else:
@@ -311,39 +373,37 @@ class BranchData:
 			msg0 = (('The following {} have a rating of less than or equal to {:.2f} MVA and have '
 					 'therefore been ignored from checking for compliance')
 				.format(asset, constants.EirGridThresholds.rating_threshold))
-			msg1 = '\n'.join(['\t - {} connected between busbars {} and {} with ID {}'
-							 .format(asset.capitalize(), row[self.c.from_bus], row[self.c.to_bus], row[self.c.id])
-							  for _, row in items_with_no_rating.iterrows()])
+			asset_name = asset.capitalize()
+			msg1 = '\n'.join(
+				'\t - {} connected between busbars {} and {} with ID {}'.format(asset_name, bus1, bus2, ckt)
+				for bus1, bus2, ckt in zip(
+					items_with_no_rating[self.c.from_bus].to_numpy(),
+					items_with_no_rating[self.c.to_bus].to_numpy(),
+					items_with_no_rating[self.c.id].to_numpy()
+				)
+			)
 			self.logger.warning('{}\n{}'.format(msg0, msg1))
 
 		# Steady state validation
-		compliance = dict()
-
-		# Loop through each contingency and check if all steady state circuit loadings are within limits
+		# Check if all steady state circuit loadings are within limits
 		df_loading = self.df_loading
 		df_loading.loc[:, 'Threshold'] = constants.EirGridThresholds.rating_threshold
 
-		for cont in cont_names:
-			# Check to see if loading is less than rating where rating is > the EirGrid threshold value
-			condition = ((self.df_loading[cont] < self.df_loading[constants.Contingency.rate_for_checking]) |
-						 (constants.EirGridThresholds.rating_threshold ==
-						  df_loading[constants.Contingency.rate_for_checking]))
+		# Check to see if loading is less than rating where rating is > the EirGrid threshold value, all contingencies
+		# are checked together with the rating broadcast across the columns
+		condition = ((df_loading[cont_names].to_numpy(dtype=float) < rating[:, np.newaxis]) |
+					 no_rating[:, np.newaxis])
 
-			# Check compliant at all busbars
-			compliance[cont] = all(np.where(condition, True, False))
+		# Check compliant for all circuits and update DataFrame with new row to show whether compliant
+		compliance = condition.all(axis=0).tolist()
+		self.df_loading.loc[constants.Contingency.compliant, cont_names] = compliance
 
-		# Update DataFrame with new row to show whether compliant
-		for key, value in compliance.iteritems():
-			self.df_loading.loc[constants.Contingency.compliant, key] = value
-
-		# Return slice from DataFrame showing whether this dataframe is compliant
+		# Return DataFrame showing whether each contingency is compliant
 		if self.tx:
 			col_title = constants.Excel.tx2_loading
 		else:
 			col_title = constants.Excel.circuit_loading
-		df_compliance = pd.DataFrame(index=cont_names, columns=(col_title,))
-		df_compliance[col_title] = self.df_loading.loc[constants.Contingency.compliant,
-													   cont_names]
+		df_compliance = pd.DataFrame(data={col_title: compliance}, index=cont_names)
 
 		return df_compliance
 
@@ -358,6 +418,8 @@ class ShuntData:
 		"""
 		# Initialise empty variables
 		self.df_status = pd.DataFrame()
+		# Original status of each shunt keyed by (busbar, ID)
+		self.status_by_key = dict()
 
 		# constants
 		self.logger = logging.getLogger(constants.Logging.logger_name)
@@ -379,11 +441,38 @@ class ShuntData:
 		# Update DataFrame from PSSE case
 		self.update()
 
-	def update(self, cont_name=None):
+	def update(self, cont_name=None, unchanged=False):
 		"""
 			Updates data from SAV case
 		:param str cont_name:  Contingency name for these results
+		:param bool unchanged:  (optional=False) - If True then the contingency does not switch any shunts of this
+			type and so the base case status is recorded without retrieving it from PSSE
 		"""
+		if self.fixed:
+			msg = 'fixed'
+		else:
+			msg = 'switched'
+
+		# For a contingency only the status is recorded, the busbars and IDs are unchanged from the base case and so
+		# are not retrieved from PSSE again
+		if cont_name is not None:
+			# Nothing to populate if there are no shunts of this type
+			if self.df_status.empty:
+				return None
+			if unchanged:
+				self.df_status[cont_name] = self.df_status[constants.Contingency.bc].to_numpy()
+				return None
+
+			ierr_int, iarray = self.func_int(sid=self.sid, flag=self.flag, string=(self.c.status,))
+			if ierr_int > 0:
+				self.logger.error(('Unable to retrieve the {} shunt data from the SAV case and the following error code '
+								   'was returned: {} from function <{}>')
+								  .format(msg, ierr_int, self.func_int.__name__))
+				raise ValueError('Error importing data from PSSE SAV case')
+
+			# Add new column to DataFrame with the status of the shunt during this contingency
+			self.df_status[cont_name] = np.array(iarray[0], dtype=np.int8)
+			return None
 
 		# Retrieve data from PSSE
 		ierr_int, iarray = self.func_int(
@@ -401,10 +490,6 @@ class ShuntData:
 			string=(str_identifier,))
 
 		if ierr_int > 0 or ierr_char > 0:
-			if self.fixed:
-				msg = 'fixed'
-			else:
-				msg = 'switched'
 			self.logger.error(('Unable to retrieve the {} shunt data from the SAV case and the following error codes '
 							   'were returned: {} and {} from functions <{}> and <{}>')
 							  .format(msg,
@@ -412,37 +497,57 @@ class ShuntData:
 									  self.func_int.__name__, self.func_char.__name__))
 			raise ValueError('Error importing data from PSSE SAV case')
 
+		# Remove empty string in ID column (PSSE will return '1' as '1 ' but will accept '1' as an input), stripped as a
+		# list before the DataFrame is created
+		carray[0] = [x.strip() for x in carray[0]]
+
 		# Combine data into single list of lists
 		# Populate the complete DataFrame, overwriting any new values
 		data = iarray + carray
 		# Column headers initially in same order as data but then reordered to something more useful for exporting
 		# in case needed
 		initial_columns = [self.c.bus, self.c.status, self.c.id]
-		# Transposed so columns in correct location and then columns reordered to something more suitable
-		complete_df = pd.DataFrame(data).transpose()
-		complete_df.columns = initial_columns
-		# Remove empty string in ID column (PSSE will return '1' as '1 ' but will accept '1' as an input
-		if not complete_df.empty:
-			complete_df[self.c.id] = complete_df[self.c.id].str.strip()
-		else:
+		# Built column by column from the lists returned by PSSE so no transposed copy is needed, columns are kept as
+		# objects so that the compliance labels can later be added to the same columns
+		complete_df = pd.DataFrame(data=dict(zip(initial_columns, data)), dtype=object)
+		# Nothing to populate if there are no shunts of this type
+		if complete_df.empty:
 			return
 
-		if cont_name is None:
-			# Extract data for status of branch
-			columns_for_status = [self.c.bus, self.c.id, self.c.status]
-			self.df_status = complete_df[columns_for_status]
-			# Add column for base case results
-			self.df_status[constants.Contingency.bc] = self.df_status[self.c.status]
+		# IDs are repeated across many shunts and so are stored as categoricals
+		complete_df[self.c.id] = complete_df[self.c.id].astype('category')
+		# Extract data for status of branch
+		columns_for_status = [self.c.bus, self.c.id, self.c.status]
+		self.df_status = complete_df[columns_for_status].copy(deep=False)
+		# Add column for base case results
+		self.df_status[constants.Contingency.bc] = self.df_status[self.c.status].to_numpy(dtype=np.int8)
+		# Original status of each shunt so it can be looked up directly when restoring a shunt
+		self.status_by_key = dict(zip(
+			zip(complete_df[self.c.bus].tolist(), complete_df[self.c.id].tolist()),
+			complete_df[self.c.status].tolist()
+		))
+		return None
 
-		else:
-			# Add new column to DataFrame with the status of the circuit during this contingency
-			self.df_status[cont_name] = complete_df[self.c.status]
+	def get_status(self):
+		"""
+			Returns the current status of every shunt in the PSSE case, in the same order as <df_status>
+		:return np.ndarray status:  Array of the shunt status values
+		"""
+		func_int = self.func_int
+		ierr_int, iarray = func_int(sid=self.sid, flag=self.flag, string=(self.c.status,))
+		if ierr_int > 0:
+			self.logger.error(('Unable to retrieve the shunt status from the SAV case and the following error code '
+							   'was returned: {} from function <{}>')
+							  .format(ierr_int, func_int.__name__))
+			raise ValueError('Error importing data from PSSE SAV case')
+
+		return np.asarray(iarray[0])
 
 	def change_state(self, asset=pd.Series(),
 					 restore=False, restore_all=False):
 		"""
 			Switches the status of the branch for a specific contingency and updates the branch status
-		:param pd.Series asset: (optional=pd.Series()) Branch whose status is to be changed
+		:param pd.Series / dict asset: (optional=pd.Series()) Branch whose status is to be changed
 		:param bool restore: (optional=False) - if set to True then will restore single branch back to original value
 		:param bool restore_all: (optional=False) - if set to True then will restore every branch back to original value
 		:return bool success: Whether change of state worked correctly or not
@@ -453,26 +558,26 @@ class ShuntData:
 		success = False
 
 		if restore_all:
-			# Loop through and restore every asset to its original status
-			for i, row in self.df_status.iterrows():
-				# TODO: This may be quite slow so could be useful to find out current status and only switch those
-				# TODO: which are actually different
+			# Nothing to restore if there are no assets of this type
+			if self.df_status.empty:
+				return success
+			# Only those assets where the current status in PSSE differs from the original status are restored, the
+			# columns are extracted as arrays once rather than creating a series for every row
+			buses = self.df_status[self.c.bus].to_numpy()
+			ckts = self.df_status[self.c.id].to_numpy()
+			statuses = self.df_status[self.c.status].to_numpy()
+			changed = np.flatnonzero(self.get_status() != statuses)
 
-				# TODO: Currently will loop through every asset since they are duplicated in direction, should detect this
-				bus = row[self.c.status]
-				ckt = row[self.c.id]
-				status = row[self.c.status]
-				success = self.switch(bus, ckt, status)
+			success = True
+			for k in changed:
+				success = self.switch(buses[k], ckts[k], statuses[k]) and success
 
 		else:
 			bus = asset[self.c.bus]
 			ckt = asset[self.c.id]
 			if restore:
 				# Get original status value
-				status = self.df_status.loc[
-					(self.df_status[self.c.bus] == bus) &
-					(self.df_status[self.c.id] == ckt),
-					self.c.status].item()
+				status = self.status_by_key[(bus, ckt)]
 			else:
 				status = asset[self.c.status]
 
@@ -536,6 +641,11 @@ class Tx3WndData:
 		self.flag = flag
 		self.sid = sid
 
+		# Functions for retrieving data from PSSE
+		self.func_int = psspy.awndint
+		self.func_char = psspy.awndchar
+		self.func_real = psspy.awndreal
+
 		# Update DataFrame from PSSE case
 		self.update()
 
@@ -544,15 +654,33 @@ class Tx3WndData:
 			Updates data from SAV case
 		:param str cont_name:  If provided will add the updated data to an existing dataframe
 		"""
-		# Declare functions
-		func_int = psspy.awndint
-		func_char = psspy.awndchar
-		func_real = psspy.awndreal
+		# Functions bound once when the class is initialised
+		func_int = self.func_int
+		func_char = self.func_char
+		func_real = self.func_real
 
 		# Function input constants
 		entry = 1
 		ties = 3
 
+		# For a contingency only the status and loading are recorded, the busbars, IDs and ratings are unchanged from
+		# the base case and so are not retrieved from PSSE again
+		if cont_name is not None:
+			ierr_int, iarray = func_int(sid=self.sid, flag=self.flag, entry=entry, ties=ties, string=(self.c.status,))
+			ierr_real, rarray = func_real(
+				sid=self.sid, flag=self.flag, entry=entry, ties=ties, string=(self.c.loading,)
+			)
+			if ierr_int > 0 or ierr_real > 0:
+				self.logger.error(('Unable to retrieve the area data from the SAV case and the following error codes '
+								   'were returned: {} and {} from functions <{}> and <{}>')
+								  .format(ierr_int, ierr_real, func_int.__name__, func_real.__name__))
+				raise ValueError('Error importing data from PSSE SAV case')
+
+			# Add column of status and loading for this contingency
+			self.df_status[cont_name] = np.array(iarray[0], dtype=np.int8)
+			self.df_loading[cont_name] = np.array(rarray[0], dtype=object)
+			return None
+
 		# Retrieve data from PSSE
 		ierr_int, iarray = func_int(
 			sid=self.sid,
@@ -586,6 +714,10 @@ class Tx3WndData:
 									  func_int.__name__, func_char.__name__, func_real.__name__))
 			raise ValueError('Error importing data from PSSE SAV case')
 
+		# Remove empty string in ID column (PSSE will return '1' as '1 ' but will accept '1' as an input), stripped as a
+		# list before the DataFrame is created
+		carray[0] = [x.strip() for x in carray[0]]
+
 		# Combine data into single list of lists
 		data = iarray + carray + rarray
 		# Column headers initially in same order as data but then reordered to something more useful for exporting
@@ -594,31 +726,29 @@ class Tx3WndData:
 						   self.c.status, self.c.id, self.c.ratea, self.c.rateb, self.c.ratec,
 						   self.c.loading]
 
-		# Transposed so columns in correct location and then columns reordered to something more suitable
-		combined_df = pd.DataFrame(data).transpose()
-		combined_df.columns = initial_columns
-
-		# Remove empty string in ID column (PSSE will return '1' as '1 ' but will accept '1' as an input
-		combined_df[self.c.id] = combined_df[self.c.id].str.strip()
+		# Built column by column from the lists returned by PSSE so no transposed copy is needed, columns are kept as
+		# objects so that the compliance labels can later be added to the same columns
+		combined_df = pd.DataFrame(data=dict(zip(initial_columns, data)), dtype=object)
+		# Ratings never have labels added and so are stored as floats to be compared without any conversion
+		rating_columns = [self.c.ratea, self.c.rateb, self.c.ratec]
+		combined_df[rating_columns] = combined_df[rating_columns].astype(np.float64)
+		# IDs are repeated across many transformers and so are stored as categoricals
+		combined_df[self.c.id] = combined_df[self.c.id].astype('category')
 
 		# Populate the complete DataFrame, overwriting any new values
-		if cont_name is None:
-			status_columns = [self.c.this_winding, self.c.wind1, self.c.wind2, self.c.wind3,
-							  self.c.id, self.c.status]
-			loading_columns = [self.c.this_winding, self.c.wind1, self.c.wind2, self.c.wind3,
-							   self.c.id, self.c.ratea, self.c.rateb, self.c.ratec,
-							   self.c.loading]
-
-			# Transposed so columns in correct location and then columns reordered to something more suitable
-			self.df_status = combined_df[status_columns]
-			self.df_loading = combined_df[loading_columns]
-			# Add column for base case
-			self.df_status[constants.Contingency.bc] = self.df_status[self.c.status]
-			self.df_loading[constants.Contingency.bc] = self.df_loading[self.c.loading]
-		else:
-			# Add column of status for this contingency
-			self.df_status[cont_name] = combined_df[self.c.status]
-			self.df_loading[cont_name] = combined_df[self.c.loading]
+		status_columns = [self.c.this_winding, self.c.wind1, self.c.wind2, self.c.wind3,
+						  self.c.id, self.c.status]
+		loading_columns = [self.c.this_winding, self.c.wind1, self.c.wind2, self.c.wind3,
+						   self.c.id, self.c.ratea, self.c.rateb, self.c.ratec,
+						   self.c.loading]
+
+		# Transposed so columns in correct location and then columns reordered to something more suitable
+		self.df_status = combined_df[status_columns].copy(deep=False)
+		self.df_loading = combined_df[loading_columns].copy(deep=False)
+		# Add column for base case
+		self.df_status[constants.Contingency.bc] = self.df_status[self.c.status].to_numpy(dtype=np.int8)
+		self.df_loading[constants.Contingency.bc] = self.df_loading[self.c.loading].to_numpy()
+		return None
 
 	def check_compliance(self, cont_names):
 		"""
@@ -628,39 +758,38 @@ class Tx3WndData:
 								validation
 		:return None:
 		"""
-		# Get list of transformers which do not have any winding data
-		items_with_no_rating = self.df_loading[self.df_loading[constants.Contingency.rate_for_checking] <=
-											   constants.EirGridThresholds.rating_threshold]
-		if not items_with_no_rating.empty:
+		# Get list of transformers which do not have any winding data, only reported when there are any
+		rating = self.df_loading[constants.Contingency.rate_for_checking].to_numpy()
+		no_rating = rating <= constants.EirGridThresholds.rating_threshold
+		if no_rating.any():
+			items_with_no_rating = self.df_loading.iloc[np.flatnonzero(no_rating)]
 			msg0 = (('The following 3 winding transformer have a rating of less than or equal to {:.2f} MVA and have '
 					 'therefore been ignored from checking for compliance')
 					.format(constants.EirGridThresholds.rating_threshold))
-			msg1 = '\n'.join(['\t - Transformer connected between busbars {}, {}, {} with ID {}'
-							  .format(row[self.c.wind1], row[self.c.wind2], row[self.c.wind3], row[self.c.id])
-							  for _, row in items_with_no_rating.iterrows()])
+			msg1 = '\n'.join(
+				'\t - Transformer connected between busbars {}, {}, {} with ID {}'.format(bus1, bus2, bus3, ckt)
+				for bus1, bus2, bus3, ckt in zip(
+					items_with_no_rating[self.c.wind1].to_numpy(),
+					items_with_no_rating[self.c.wind2].to_numpy(),
+					items_with_no_rating[self.c.wind3].to_numpy(),
+					items_with_no_rating[self.c.id].to_numpy()
+				)
+			)
 			self.logger.warning('{}\n{}'.format(msg0, msg1))
 
 		# Steady state validation
-		compliance = dict()
-		# Loop through each contingency and check if all steady state voltages are within limits
-		for cont in cont_names:
-			# Check to see if loading is less than rating where rating is > the EirGrid threshold value
-			condition = ((self.df_loading[cont] < self.df_loading[constants.Contingency.rate_for_checking]) |
-						 (self.df_loading[constants.Contingency.rate_for_checking] <=
-						  constants.EirGridThresholds.rating_threshold))
-
-			# Check compliant at all busbars
-			compliance[cont] = all(np.where(condition, True, False))
-
-		# Update DataFrame with new row to show whether compliant
-		for key, value in compliance.iteritems():
-			self.df_loading.loc[constants.Contingency.compliant, key] = value
-
-		# Return slice from DataFrame showing whether each contingency is compliant
+		# Check to see if loading is less than rating where rating is > the EirGrid threshold value, all contingencies
+		# are checked together with the rating broadcast across the columns
+		condition = ((self.df_loading[cont_names].to_numpy(dtype=float) < rating[:, np.newaxis]) |
+					 no_rating[:, np.newaxis])
+
+		# Check compliant for all transformers and update DataFrame with new row to show whether compliant
+		compliance = condition.all(axis=0).tolist()
+		self.df_loading.loc[constants.Contingency.compliant, cont_names] = compliance
+
+		# Return DataFrame showing whether each contingency is compliant
 		col_title = constants.Excel.tx3_loading
-		df_compliance = pd.DataFrame(index=cont_names, columns=(col_title,))
-		df_compliance[col_title] = self.df_loading.loc[constants.Contingency.compliant,
-													   cont_names]
+		df_compliance = pd.DataFrame(data={col_title: compliance}, index=cont_names)
 
 		return df_compliance
 
@@ -676,6 +805,8 @@ class Tx3Data:
 		"""
 		# Initialise empty variables
 		self.df = pd.DataFrame()
+		# Original status of each transformer keyed by (winding 1 busbar, winding 2 busbar, winding 3 busbar, ID)
+		self.status_by_key = dict()
 
 		# constants
 		self.logger = logging.getLogger(constants.Logging.logger_name)
@@ -686,6 +817,10 @@ class Tx3Data:
 		self.flag = flag
 		self.sid = sid
 
+		# Functions for retrieving data from PSSE
+		self.func_int = psspy.atr3int
+		self.func_char = psspy.atr3char
+
 		# Update DataFrame from PSSE case
 		self.update()
 
@@ -694,14 +829,28 @@ class Tx3Data:
 			Updates data from SAV case
 		:param str cont_name:  If provided will add the updated data to an existing dataframe
 		"""
-		# Declare functions
-		func_int = psspy.atr3int
-		func_char = psspy.atr3char
+		# Functions bound once when the class is initialised
+		func_int = self.func_int
+		func_char = self.func_char
 
 		# Function input constants
 		entry = 1
 		ties = 3
 
+		# For a contingency only the status is recorded, the busbars and IDs are unchanged from the base case and so
+		# are not retrieved from PSSE again
+		if cont_name is not None:
+			ierr_int, iarray = func_int(sid=self.sid, flag=self.flag, ties=ties, entry=entry, string=(self.c.status,))
+			if ierr_int > 0:
+				self.logger.error(('Unable to retrieve the area data from the SAV case and the following error code '
+								   'was returned: {} from function <{}>')
+								  .format(ierr_int, func_int.__name__))
+				raise ValueError('Error importing data from PSSE SAV case')
+
+			# Add column of status for this contingency
+			self.df[cont_name] = np.array(iarray[0], dtype=np.int8)
+			return None
+
 		# Retrieve data from PSSE
 		ierr_int, iarray = func_int(
 			sid=self.sid,
@@ -724,34 +873,55 @@ class Tx3Data:
 							  .format(ierr_int, ierr_char, func_int.__name__, func_char.__name__))
 			raise ValueError('Error importing data from PSSE SAV case')
 
+		# Remove empty string in ID column (PSSE will return '1' as '1 ' but will accept '1' as an input), stripped as a
+		# list before the DataFrame is created
+		carray[0] = [x.strip() for x in carray[0]]
+
 		# Combine data into single list of lists
 		data = iarray + carray
 		# Column headers initially in same order as data but then reordered to something more useful for exporting
 		# in case needed
 		initial_columns = [self.c.wind1, self.c.wind2, self.c.wind3, self.c.status, self.c.id]
 
-		# Transposed so columns in correct location and then columns reordered to something more suitable
-		combined_df = pd.DataFrame(data).transpose()
-		combined_df.columns = initial_columns
+		# Built column by column from the lists returned by PSSE so no transposed copy is needed, columns are kept as
+		# objects so that the compliance labels can later be added to the same columns
+		combined_df = pd.DataFrame(data=dict(zip(initial_columns, data)), dtype=object)
+
+		# IDs are repeated across many transformers and so are stored as categoricals
+		combined_df[self.c.id] = combined_df[self.c.id].astype('category')
+		# Column ordering for exported dataframe
+		status_columns = [self.c.wind1, self.c.wind2, self.c.wind3, self.c.id, self.c.status]
+		self.df = combined_df[status_columns].copy(deep=False)
+		# Add column for base case results
+		self.df[constants.Contingency.bc] = self.df[self.c.status].to_numpy(dtype=np.int8)
+		# Original status of each transformer so it can be looked up directly when restoring a transformer
+		self.status_by_key = dict(zip(
+			zip(combined_df[self.c.wind1].tolist(), combined_df[self.c.wind2].tolist(),
+				combined_df[self.c.wind3].tolist(), combined_df[self.c.id].tolist()),
+			combined_df[self.c.status].tolist()
+		))
+		return None
 
-		# Remove empty string in ID column (PSSE will return '1' as '1 ' but will accept '1' as an input
-		combined_df[self.c.id] = combined_df[self.c.id].str.strip()
+	def get_status(self):
+		"""
+			Returns the current status of every 3 winding transformer in the PSSE case, in the same order as <df>
+		:return np.ndarray status:  Array of the transformer status values
+		"""
+		func_int = self.func_int
+		# Same entry and tie inputs as used to populate <df>
+		ierr_int, iarray = func_int(sid=self.sid, flag=self.flag, ties=3, entry=1, string=(self.c.status,))
+		if ierr_int > 0:
+			self.logger.error(('Unable to retrieve the 3 winding transformer status from the SAV case and the '
+							   'following error code was returned: {} from function <{}>')
+							  .format(ierr_int, func_int.__name__))
+			raise ValueError('Error importing data from PSSE SAV case')
 
-		# Populate the complete DataFrame, overwriting any new values
-		if cont_name is None:
-			# Column ordering for exported dataframe
-			status_columns = [self.c.wind1, self.c.wind2, self.c.wind3, self.c.id, self.c.status]
-			self.df = combined_df[status_columns]
-			# Add column for base case results
-			self.df[constants.Contingency.bc] = self.df[self.c.status]
-		else:
-			# Add column of status for this contingency
-			self.df[cont_name] = combined_df[self.c.status]
+		return np.asarray(iarray[0])
 
 	def change_state(self, asset=pd.Series(), restore=False, restore_all=False):
 		"""
 			Switches the status of the branch for a specific contingency and updates the branch status
-		:param pd.Series asset: (optional=pd.Series()) 3 Winding transformer whose status is to be changed
+		:param pd.Series / dict asset: (optional=pd.Series()) 3 Winding transformer whose status is to be changed
 		:param bool restore: (optional=False) - if set to True then will restore single tx3 back to original value
 		:param bool restore_all: (optional=False) - if set to True then will restore every tx3 back to original value
 		:return bool success:  Whether load flow run successfully or not
@@ -759,18 +929,21 @@ class Tx3Data:
 		success = False
 
 		if restore_all:
-			# Loop through and restore every branch to its original status
-			for i, row in self.df.iterrows():
-				# TODO: This may be quite slow so could be useful to find out current status and only switch those
-				# TODO: which are actually different
-
-				# TODO: Currently will loop through every branch since they are duplicated in direction, should detect this
-				bus1 = row[self.c.wind1]
-				bus2 = row[self.c.wind2]
-				bus3 = row[self.c.wind3]
-				ckt = row[self.c.id]
-				status = row[self.c.status]
-				success = self.switch(bus1, bus2, bus3, ckt, status)
+			# Nothing to restore if there are no assets of this type
+			if self.df.empty:
+				return success
+			# Only those transformers where the current status in PSSE differs from the original status are restored,
+			# the columns are extracted as arrays once rather than creating a series for every row
+			buses1 = self.df[self.c.wind1].to_numpy()
+			buses2 = self.df[self.c.wind2].to_numpy()
+			buses3 = self.df[self.c.wind3].to_numpy()
+			ckts = self.df[self.c.id].to_numpy()
+			statuses = self.df[self.c.status].to_numpy()
+			changed = np.flatnonzero(self.get_status() != statuses)
+
+			success = True
+			for k in changed:
+				success = self.switch(buses1[k], buses2[k], buses3[k], ckts[k], statuses[k]) and success
 
 		else:
 			bus1 = asset[self.c.wind1]
@@ -780,12 +953,7 @@ class Tx3Data:
 
 			if restore:
 				# Status value is original value for this item
-				status = self.df.loc[
-					(self.df[self.c.wind1] == bus1) &
-					(self.df[self.c.wind2] == bus2) &
-					(self.df[self.c.wind3] == bus3) &
-					(self.df[self.c.id] == ckt),
-					self.c.status].item()
+				status = self.status_by_key[(bus1, bus2, bus3, ckt)]
 			else:
 				# otherwise use value from supplied series
 				status = asset[self.c.status]
@@ -838,6 +1006,13 @@ class BusData:
 		self.df_state = pd.DataFrame()
 		self.df_voltage_steady = pd.DataFrame()
 		self.df_voltage_step = pd.DataFrame()
+		# Original state of each busbar keyed by busbar number
+		self.state_by_bus = dict()
+		# Busbars checked against their voltage limits and those limits keyed by the busbars to ignore and the number
+		# of rows in the steady state voltages
+		self.busbars_to_check = dict()
+		# Base case voltage of each busbar
+		self.base_voltages = np.empty(0)
 
 		# Populated with list of contingency names where voltages exceeded
 		self.voltages_exceeded_steady = list()
@@ -848,20 +1023,39 @@ class BusData:
 		self.c = constants.Busbars
 		self.func_switch = psspy.bus_chng_3
 
+		# Steady state voltage bands sorted by their upper nominal voltage and the limits for each band, the bands are
+		# fixed and so are arranged once for the binary search of each busbar's band
+		bands = sorted(constants.EirGridThresholds.steady_state_limits.items(), key=lambda x: x[0][1])
+		self.voltage_bands = np.array([band for band, _ in bands], dtype=float)
+		self.voltage_band_limits = np.array([limits for _, limits in bands], dtype=float)
+
 		self.flag = flag
 		self.sid = sid
+
+		# Functions for retrieving data from PSSE
+		self.func_int = psspy.abusint
+		self.func_char = psspy.abuschar
+		self.func_real = psspy.abusreal
+
 		self.update()
 
-	def get_voltages(self):
+	def get_voltages(self, nominal=True):
 		"""
 			Returns the voltage data from the latest load flow
+		:param bool nominal: (optional=True) - If False then the nominal voltages are not retrieved from PSSE, since
+							they do not change between studies, and None is returned in their place
 		:return (list, list), (nominal, voltage):
 		"""
-		func_real = psspy.abusreal
+		if nominal:
+			attributes = (self.c.nominal, self.c.voltage)
+		else:
+			attributes = (self.c.voltage,)
+
+		func_real = self.func_real
 		ierr_real, rarray = func_real(
 			sid=self.sid,
 			flag=self.flag,
-			string=(self.c.nominal, self.c.voltage))
+			string=attributes)
 
 		if ierr_real>0:
 			self.logger.critical(('Unable to retrieve the busbar voltage data from the SAV case and PSSE returned '
@@ -870,7 +1064,9 @@ class BusData:
 								 )
 			raise SyntaxError('Error importing data from PSSE SAV case')
 
-		return rarray[0], rarray[1]
+		if nominal:
+			return rarray[0], rarray[1]
+		return None, rarray[0]
 
 	def update(self, cont_name=None, step=False):
 		"""
@@ -878,9 +1074,24 @@ class BusData:
 		:param str cont_name: (optional=None) - If a name is provided then this is used for the column header
 		:param bool step: (optional=False) - If a step change voltage then update associated data frame
 		"""
-		# Declare functions
-		func_int = psspy.abusint
-		func_char = psspy.abuschar
+		# Functions bound once when the class is initialised
+		func_int = self.func_int
+		func_char = self.func_char
+
+		# For a contingency only the busbar state is recorded and so only that is retrieved from PSSE and written
+		# straight into the results, the busbar numbers, names and nominal voltages are unchanged from the base case
+		if cont_name is not None:
+			ierr_int, iarray = func_int(sid=self.sid, flag=self.flag, string=(self.c.state,))
+			if ierr_int > 0:
+				self.logger.critical(('Unable to retrieve the busbar type codes from the SAV case and PSSE returned the '
+									  'following error code {} from the function <{}>')
+									 .format(ierr_int, func_int.__name__)
+									 )
+				raise SyntaxError('Error importing data from PSSE SAV case')
+
+			# Update status of busbar
+			self.df_state[cont_name] = np.array(iarray[0], dtype=np.int8)
+			return None
 
 		# Retrieve data from PSSE
 		ierr_int, iarray = func_int(
@@ -910,36 +1121,34 @@ class BusData:
 		state_columns = [self.c.bus, self.c.bus_name, self.c.nominal, self.c.state]
 		voltage_columns = [self.c.bus, self.c.bus_name, self.c.nominal, self.c.voltage]
 
-		# Transposed so columns in correct location and then columns reordered to something more suitable
-		df = pd.DataFrame(data).transpose()
-		df.columns = initial_columns
-		df.index = df[self.c.bus]
+		# Built column by column from the lists returned by PSSE so no transposed copy is needed, columns are kept as
+		# objects so that the compliance labels can later be added to the same columns
+		df = pd.DataFrame(data=dict(zip(initial_columns, data)), dtype=object)
+		# Indexed by busbar number as integers taken from the list returned by PSSE rather than the object column
+		df.index = pd.Index(np.asarray(iarray[0], dtype=np.int64), name=self.c.bus)
 
-		if cont_name is None:
-			# Since not a contingency populate all columns
-			self.df_state = df[state_columns]
-			self.df_voltage_steady = df[voltage_columns]
-			self.df_voltage_step = df[voltage_columns]
+		self.df_state = df[state_columns].copy(deep=False)
+		self.df_voltage_steady = df[voltage_columns].copy(deep=False)
+		self.df_voltage_step = df[voltage_columns].copy(deep=False)
 
-			# Insert steady_state voltage limits
-			self.add_voltage_limits(df=self.df_voltage_steady)
+		# Insert steady_state voltage limits
+		self.add_voltage_limits(df=self.df_voltage_steady)
 
-			# Add column for base case results
-			self.df_state[constants.Contingency.bc] = self.df_state[self.c.state]
-			self.df_voltage_steady[constants.Contingency.bc] = self.df_voltage_steady[self.c.voltage]
-			self.df_voltage_step[constants.Contingency.bc] = self.df_voltage_step[self.c.voltage]
+		# Busbars to check against their voltage limits are found again for the new busbar data
+		self.busbars_to_check = dict()
 
-		else:
-			# Update status of busbar
-			self.df_state[cont_name] = df[self.c.state]
+		# Original state of each busbar so it can be looked up directly when restoring a busbar
+		self.state_by_bus = dict(zip(self.df_state[self.c.bus].tolist(), self.df_state[self.c.state].tolist()))
+
+		# Add column for base case results
+		self.df_state[constants.Contingency.bc] = self.df_state[self.c.state].to_numpy(dtype=np.int8)
+		self.df_voltage_steady[constants.Contingency.bc] = self.df_voltage_steady[self.c.voltage].to_numpy()
+		self.df_voltage_step[constants.Contingency.bc] = self.df_voltage_step[self.c.voltage].to_numpy()
 
-			# State change stored when changing status
-			# #if step:
-			# #	# If this is run for a step change voltage then update voltage values
-			# #	self.df_voltage_step[cont_name] = df_status[self.c.voltage]
-			# #else:
-			# #	# If this is run for a steady state voltage then update voltage values
-			# #	self.df_voltage_steady[cont_name] = df_status[self.c.voltage]
+		# Base case voltages as floats for the step change compliance checks, the busbars are always the first rows of
+		# the voltage results with any labels only ever added after them
+		self.base_voltages = self.df_voltage_step[self.c.voltage].to_numpy(dtype=float)
+		return None
 
 	def add_voltage_limits(self, df):
 		"""
@@ -948,34 +1157,41 @@ class BusData:
 				voltage under the column [c.nominal]
 		"""
 
-		# Get voltage limits from constants which are returned as a dictionary
-		v_limits = constants.EirGridThresholds.steady_state_limits
-
-		# Convert to a DataFrame
-		df_limits = pd.concat([pd.DataFrame(data=v_limits.keys()),
-							   pd.DataFrame(data=v_limits.values())],
-							  axis=1)
 		c = constants.Busbars
-		df_limits.columns = [c.nominal_lower, c.nominal_upper, c.lower_limit, c.upper_limit]
-
-		# Add limits into busbars voltage DataFrame
-		for i, row in df_limits.iterrows():
-			# Add lower limit values
-			df.loc[
-				(df[c.nominal] > row[c.nominal_lower]) &
-				(df[c.nominal] <= row[c.nominal_upper]),
-				c.lower_limit] = row[c.lower_limit]
-			# Add upper limit values
-			df.loc[
-				(df[c.nominal] > row[c.nominal_lower]) &
-				(df[c.nominal] <= row[c.nominal_upper]),
-				c.upper_limit] = row[c.upper_limit]
+		# Voltage bands and their limits sorted when the class is initialised
+		bounds = self.voltage_bands
+		limits = self.voltage_band_limits
+
+		# Band each busbar falls within is the first band whose upper nominal voltage is not exceeded, busbars which are
+		# not above the lower nominal voltage of that band are outside all bands and so are given no limits
+		nominal = df[c.nominal].to_numpy(dtype=float)
+		idx = np.minimum(np.searchsorted(bounds[:, 1], nominal, side='left'), len(bounds) - 1)
+		in_band = (nominal > bounds[idx, 0]) & (nominal <= bounds[idx, 1])
+
+		# Add lower and upper limit values
+		df[c.lower_limit] = np.where(in_band, limits[idx, 0], np.nan)
+		df[c.upper_limit] = np.where(in_band, limits[idx, 1], np.nan)
 		return None
 
+	def get_state(self):
+		"""
+			Returns the current type code of every busbar in the PSSE case, in the same order as <df_state>
+		:return np.ndarray state:  Array of the busbar type codes
+		"""
+		func_int = self.func_int
+		ierr_int, iarray = func_int(sid=self.sid, flag=self.flag, string=(self.c.state,))
+		if ierr_int > 0:
+			self.logger.critical(('Unable to retrieve the busbar type codes from the SAV case and PSSE returned the '
+								  'following error code {} from the function <{}>')
+								 .format(ierr_int, func_int.__name__))
+			raise SyntaxError('Error importing data from PSSE SAV case')
+
+		return np.asarray(iarray[0])
+
 	def change_state(self, asset=pd.Series(), restore=False, restore_all=False):
 		"""
 			Changes the status of the busbar
-		:param pd.Series asset: (optional=pd.Series()) Busbar whose state is to be changed
+		:param pd.Series / dict asset: (optional=pd.Series()) Busbar whose state is to be changed
 		:param bool restore: (optional=False) - if set to True then will restore this busbar back to original value
 		:param bool restore_all: (optional=False) - if set to True then will restore every busbar back to original value
 		:return bool success:  True / False on whether able to change state
@@ -983,22 +1199,24 @@ class BusData:
 		success = False
 
 		if restore_all:
-			# Loop through and restore every branch to its original status
-			for i, row in self.df_state.iterrows():
-				# TODO: This may be quite slow so could be useful to find out current status and only switch those
-				# TODO: which are actually different
+			# Nothing to restore if there are no busbars
+			if self.df_state.empty:
+				return success
+			# Only those busbars where the current state in PSSE differs from the original state are restored, the
+			# columns are extracted as arrays once rather than creating a series for every row
+			buses = self.df_state[self.c.bus].to_numpy()
+			states = self.df_state[self.c.state].to_numpy()
+			changed = np.flatnonzero(self.get_state() != states)
 
-				# TODO: Currently will loop through every branch since they are duplicated in direction, should detect this
-				bus = row[self.c.bus]
-				state = row[self.c.state]
-				success = self.switch(bus, state)
+			success = True
+			for k in changed:
+				success = self.switch(buses[k], states[k]) and success
 
 		else:
 			bus = asset[self.c.bus]
 			if restore:
-				state = self.df_state.loc[
-					(self.df_state[self.c.bus] == bus),
-					self.c.state]
+				# Get original state value
+				state = self.state_by_bus[bus]
 			else:
 				state = asset[self.c.state]
 
@@ -1035,8 +1253,13 @@ class BusData:
 		:param str cont_name: Name of contingency that this relates to
 		:return:
 		"""
-		# check if cont_name already in DataFrame and if not add it populated with the initial status values
-		self.df_state[cont_name] = buses[self.c.state]
+		# check if cont_name already in DataFrame and if not add it populated with the initial status values, the
+		# positions of the islanded busbars are found once and written into an array rather than aligning a Series
+		states = np.full(len(self.df_state), np.nan)
+		positions = self.df_state.index.get_indexer(buses.index)
+		found = positions >= 0
+		states[positions[found]] = buses[self.c.state].to_numpy()[found]
+		self.df_state[cont_name] = states
 
 	def update_voltages(self, cont_name, voltage_step, non_convergence=False):
 		"""
@@ -1046,21 +1269,26 @@ class BusData:
 		:param bool voltage_step: If True then updated self.df_voltage_step, if False then updates self.df_voltage_steady
 		:return None:
 		"""
+		# Updates the relevant DataFrame depending on the study being done
+		if voltage_step:
+			df = self.df_voltage_step
+		else:
+			df = self.df_voltage_steady
+
 		# If non-convergence then set every value to this value
 		if non_convergence:
-			self.logger.debug('Non convergence = {}'.format(non_convergence))
+			self.logger.debug('Non convergence = %s', non_convergence)
 			# Assumes non-convergent is the same in all cases
-			latest_voltages = np.nan
+			latest_voltages = np.full(len(df), np.nan, dtype=object)
 		else:
-			# Retrieves the latest voltage values from the PSSE case
-			_, latest_voltages = self.get_voltages()
+			# Retrieves the latest voltage values from the PSSE case, the nominal voltages are unchanged from the base case
+			# and so are not retrieved again
+			_, latest_voltages = self.get_voltages(nominal=False)
+			latest_voltages = np.array(latest_voltages, dtype=object)
 
-		# Updates the relevant DataFrame depending on the study being done
-		if voltage_step:
-			# Convert value to a step change rather than actual voltage
-			self.df_voltage_step[cont_name] = latest_voltages
-		else:
-			self.df_voltage_steady[cont_name] = latest_voltages
+		# Voltages are stored as objects, in the same way as the base case, so that the compliance flags and step
+		# change limit can be written into each contingency column as a single row without the column being converted
+		df[cont_name] = latest_voltages
 
 		return None
 
@@ -1078,65 +1306,52 @@ class BusData:
 														True/False for each contingency to determine whether it was
 														compliant to this test
 		"""
-		# Return slice from DataFrame showing whether this dataframe is compliant
-		# Steady state validation
-		compliance = dict()
-
-		rows_to_ignore = [constants.Contingency.v_step_lbl, constants.Contingency.compliant]
+		# Busbars are the first rows of the voltage results and so any label rows (i.e. Compliant) that have already
+		# been added after them are excluded by position rather than searching the index for them
+		n_busbars = len(self.base_voltages)
 
 		# Only check for steady state voltages if no limit provided
 		if voltage_step_limit is None:
-			# Empty DataFrame that will be populated with compliance data
-			df_compliance = pd.DataFrame(index=cont_names, columns=(constants.Excel.voltage_steady,))
-			# Loop through each contingency and check if all steady state voltages are within limits
-			for cont in cont_names:
-				# Condition for check
-				condition = ((self.df_voltage_steady[cont] <= self.df_voltage_steady[self.c.upper_limit]) &
-							(self.df_voltage_steady[cont] >= self.df_voltage_steady[self.c.lower_limit]))
-				# Check compliant at all busbars
-				compliance[cont] = all(np.where(condition, True, False))
-
-			# Update DataFrame with new row to show whether compliant
-			for key, value in compliance.iteritems():
-				self.df_voltage_steady.loc[constants.Contingency.compliant, key] = value
-
-			df_compliance[constants.Excel.voltage_steady] = self.df_voltage_steady.loc[constants.Contingency.compliant,
-																					   cont_names]
+			# Check if all steady state voltages are within limits for every contingency at once, with the limits for
+			# each busbar broadcast across the columns, rows which are not busbars are removed from the arrays rather
+			# than taking a copy of the whole DataFrame without them
+			df_voltages = self.df_voltage_steady
+			voltages = df_voltages[cont_names].to_numpy(dtype=float)[:n_busbars]
+			upper_limit = df_voltages[self.c.upper_limit].to_numpy(dtype=float)[:n_busbars, np.newaxis]
+			lower_limit = df_voltages[self.c.lower_limit].to_numpy(dtype=float)[:n_busbars, np.newaxis]
+			condition = (voltages <= upper_limit) & (voltages >= lower_limit)
+
+			# Check compliant at all busbars and update DataFrame with new row to show whether compliant
+			compliance = condition.all(axis=0).tolist()
+			self.df_voltage_steady.loc[constants.Contingency.compliant, cont_names] = compliance
+			df_compliance = pd.DataFrame(data={constants.Excel.voltage_steady: compliance}, index=cont_names)
 		else:
-			# Empty DataFrame that will be populated with compliance data
-			df_compliance = pd.DataFrame(index=cont_names, columns=(constants.Excel.voltage_step,))
-
 			# Step change validation
-			compliance = dict()
-
-			# #compliance[constants.Contingency.bc] = True
 			# Skips base case since base case must be compliant
 			# Removes rows that shouldn't be considered in comparison
-			bad_df = self.df_voltage_step.index.isin(rows_to_ignore)
-			# Calculate voltage step by subtracting base_case values
-			df_volt_step = abs(self.df_voltage_step.loc[~bad_df, cont_names].sub(self.df_voltage_step[self.c.voltage], axis=0))
-			# Check whether compliant with step change for contingency
-			# #condition = ((self.df_voltage_step[cont] <= voltage_step_limit) |
-			# #			 (self.df_voltage_step[cont] == False))
-			condition = df_volt_step <= voltage_step_limit
-
-			for cont in cont_names:
-
-				# #condition = (abs(self.df_voltage_step[cont] - self.df_voltage_step[self.c.voltage])
-				# #			 < voltage_step_limit)
-				# Check compliant at all busbars
-				compliance[cont] = all(np.where(condition[cont], True, False))
-
-			# Update DataFrame with new row to show whether compliant
-			for key, value in compliance.iteritems():
-				# Set the compliant flag for this contingency
-				self.df_voltage_step.loc[constants.Contingency.compliant, key] = value
-				# Add in label that identifies the limit that applied to this contingency
-				self.df_voltage_step.loc[constants.Contingency.v_step_lbl, key] = voltage_step_limit
-
-			df_compliance[constants.Excel.voltage_step] = self.df_voltage_step.loc[
-				constants.Contingency.compliant, cont_names
-			]
+			voltage_step = self.df_voltage_step[cont_names].to_numpy(dtype=float)[:n_busbars]
+			# Calculate voltage step by subtracting base_case values for all contingencies at once, the subtraction and
+			# absolute value are calculated in place on the array of contingency voltages
+			voltage_step -= self.base_voltages[:, np.newaxis]
+			np.abs(voltage_step, out=voltage_step)
+			# Check whether compliant with step change for contingency at all busbars
+			compliance = (voltage_step <= voltage_step_limit).all(axis=0).tolist()
+
+			# Update DataFrame with new rows to show whether compliant and the limit that applied to each contingency,
+			# any of these rows that do not exist yet are added together so the DataFrame is only extended once.  If
+			# there are no contingencies to check then there is nothing to record and so no rows are added
+			if cont_names:
+				rows = [constants.Contingency.compliant, constants.Contingency.v_step_lbl]
+				new_rows = [x for x in rows if x not in self.df_voltage_step.index]
+				if new_rows:
+					index = self.df_voltage_step.index
+					self.df_voltage_step = self.df_voltage_step.reindex(
+						index.append(pd.Index(new_rows, name=index.name))
+					)
+				self.df_voltage_step.loc[rows, cont_names] = np.array(
+					[compliance, [voltage_step_limit] * len(cont_names)], dtype=object
+				)
+			df_compliance = pd.DataFrame(data={constants.Excel.voltage_step: compliance}, index=cont_names)
 
 		return df_compliance
 
@@ -1150,16 +1365,32 @@ class BusData:
 		# Update all busbar details for this contingency
 		self.update_voltages(cont_name=cont_name, voltage_step=False)
 
-		# Get subset of Dataframe which excludes the busbars in the ignore list and just the values for this contingency
-		df_subset = self.df_voltage_steady.loc[
-			~self.df_voltage_steady[self.c.bus].isin(busbars_to_ignore),
-			(cont_name, self.c.upper_limit)
-		]
+		# Voltages and limits for this contingency of the busbars not in the ignore list, extracted as arrays rather than
+		# creating a DataFrame subset.  The busbars and their limits do not change between iterations of the reactive
+		# compensation loop and so are only found once for each set of busbars to ignore.  The positions are only valid
+		# for the number of rows they were found for and so the number of rows forms part of the key
+		df = self.df_voltage_steady
+		key = (busbars_to_ignore, len(df))
+		if key not in self.busbars_to_check:
+			keep = ~df[self.c.bus].isin(busbars_to_ignore).to_numpy()
+			# Where no busbars are ignored a slice is used so that the voltages are checked without taking a copy
+			if keep.all():
+				keep = slice(None)
+			self.busbars_to_check[key] = (
+				keep, df.index[keep], df[self.c.upper_limit].to_numpy(dtype=float)[keep]
+			)
+		keep, busbars, upper_limits = self.busbars_to_check[key]
+		voltages = df[cont_name].to_numpy(dtype=float)[keep]
 		# Confirm voltages are within limits
-		within_limits = (df_subset[cont_name] <= df_subset[self.c.upper_limit]).all()
+		within_limits = bool((voltages <= upper_limits).all())
 
-		target_bus = df_subset.idxmax()[cont_name]
-		max_voltage = df_subset.max()[cont_name]
+		# If there are no voltages for this contingency (i.e. non-convergent) then there is no busbar to target
+		if np.isnan(voltages).all():
+			return within_limits, np.nan, np.nan
+
+		i = np.nanargmax(voltages)
+		target_bus = busbars[i]
+		max_voltage = voltages[i]
 
 		return within_limits, target_bus, max_voltage
 
@@ -1186,6 +1417,14 @@ class MachineData:
 		self.flag = flag
 		self.sid = sid
 
+		# Functions for retrieving data from PSSE
+		self.func_int = psspy.amachint
+		self.func_char = psspy.amachchar
+		self.func_real = psspy.amachreal
+		# Functions for changing the machine target voltage and reactive power output
+		self.func_target = psspy.plant_chng
+		self.func_output = psspy.machine_chng_2
+
 		# Update DataFrame from PSSE case
 		self.update()
 
@@ -1194,10 +1433,24 @@ class MachineData:
 			Updates machine data from SAV case
 		:param str cont_name: (optional=None) - If a name is provided then this is used for the column header
 		"""
-		# Declare functions
-		func_int = psspy.amachint
-		func_char = psspy.amachchar
-		func_real = psspy.amachreal
+		# Functions bound once when the class is initialised
+		func_int = self.func_int
+		func_char = self.func_char
+		func_real = self.func_real
+
+		# For a contingency only the reactive power output is recorded and so only that is retrieved from PSSE
+		if cont_name is not None:
+			ierr_real, rarray = func_real(sid=self.sid, flag=self.flag, string=(self.c.qgen,))
+			if ierr_real > 0:
+				self.logger.critical((
+					'Unable to retrieve the machine data from the SAV case and PSSE returned the error code {} from '
+					'the function <{}>'
+				).format(ierr_real, func_real.__name__))
+				raise SyntaxError('Error importing data from PSSE SAV case')
+
+			# Update reactive power output of machine
+			self.df_loading[cont_name] = np.array(rarray[0], dtype=float)
+			return None
 
 		# Retrieve data from PSSE
 		ierr_int, iarray = func_int(
@@ -1227,20 +1480,16 @@ class MachineData:
 		# in case needed
 		initial_columns = [self.c.bus, self.c.state, self.c.id, self.c.qgen]
 
-		# Transposed so columns in correct location and then columns reordered to something more suitable
-		df = pd.DataFrame(data).transpose()
-		df.columns = initial_columns
-
-		if cont_name is None:
-			# Since not a contingency populate all columns
-			self.df_loading = df[initial_columns]
+		# Built column by column from the lists returned by PSSE so no transposed copy is needed, no compliance labels
+		# are added to the machine results and so each column keeps the type returned by PSSE
+		df = pd.DataFrame(data=dict(zip(initial_columns, data)))
 
-			# Add column for base case results
-			self.df_loading[constants.Contingency.bc] = self.df_loading[self.c.qgen]
+		# Since not a contingency populate all columns
+		self.df_loading = df[initial_columns].copy(deep=False)
 
-		else:
-			# Update status of busbar
-			self.df_loading[cont_name] = df[self.c.qgen]
+		# Add column for base case results
+		self.df_loading[constants.Contingency.bc] = self.df_loading[self.c.qgen].to_numpy()
+		return None
 
 	def change_target(self, bus_num, target=1.0, target_bus=0):
 		"""
@@ -1251,7 +1500,7 @@ class MachineData:
 		:return None:
 		"""
 
-		func = psspy.plant_chng
+		func = self.func_target
 
 		ierr = func(
 			i=bus_num,
@@ -1277,7 +1526,7 @@ class MachineData:
 		:return None:
 		"""
 
-		func = psspy.machine_chng_2
+		func = self.func_output
 
 		ierr = func(
 			i=bus_num,
@@ -1302,6 +1551,12 @@ class Contingency:
 	"""
 		Will contain the details of the specific contingency event
 	"""
+	# Attributes are fixed and so are stored in slots rather than a dictionary for every contingency
+	__slots__ = (
+		'logger', 'circuits', 'tx2', 'tx3', 'busbars', 'fixed_shunts', 'switched_shunts', 'name', 'setup_correctly',
+		'convergent_v_step', 'convergent_v_steady', 'busbars_to_ignore', 'asset_records', 'voltage_control_contingency'
+	)
+
 	def __init__(self, circuits, tx2, tx3, busbars, fixed_shunts, switched_shunts, name, busbars_to_ignore):
 		"""
 			Initialise generator class instance
@@ -1335,33 +1590,46 @@ class Contingency:
 		# Function checks that the dataframe inputs are of the expected format
 		self.check_input_data()
 
+		# Each asset switched by this contingency as a dictionary of its values, the circuits, two winding
+		# transformers, three winding transformers, busbars, fixed shunts and switched shunts are converted once here
+		# rather than every time the contingency is setup or restored
+		self.asset_records = tuple(
+			df.to_dict('records') for df in (
+				self.circuits, self.tx2, self.tx3, self.busbars, self.fixed_shunts, self.switched_shunts
+			)
+		)
+
 		# Determine whether contingency is purely just voltage control switching
 		if all([self.circuits.empty, self.tx2.empty, self.tx3.empty, self.busbars.empty]):
 			self.voltage_control_contingency=True
 		else:
 			self.voltage_control_contingency = False
 
+	def __getstate__(self):
+		"""
+			Logger handle is removed when pickling so the contingency can be passed to a worker process
+		:return dict state:
+		"""
+		state = {attr: getattr(self, attr) for attr in self.__slots__ if attr != 'logger'}
+		return state
+
+	def __setstate__(self, state):
+		"""
+			Restores the contingency in a worker process and obtains the handle to the logger for that process
+		:param dict state:
+		:return None:
+		"""
+		for attr, value in state.items():
+			setattr(self, attr, value)
+		self.logger = logging.getLogger(constants.Logging.logger_name)
+
 	@property
 	def convergence_message(self):
 		"""
 			Returns whether the contingency was convergent or not
 		:return str:
 		"""
-		if not self.convergent_v_step and not self.convergent_v_steady:
-			msg = constants.Contingency.non_convergent
-		elif self.convergent_v_steady and self.convergent_v_step:
-			msg = constants.Contingency.convergent
-		elif self.convergent_v_steady and not self.convergent_v_step:
-			msg = constants.Contingency.non_convergent_vstep
-		elif self.convergent_v_step and not self.convergent_v_steady:
-			msg = constants.Contingency.non_convergent_vsteady
-		else:
-			msg = constants.Contingency.error
-			self.logger.error(
-				(
-					'Unexpected condition reached when trying to determine convergence for contingency {}'
-					' and so have assumed {}').format(self.name, constants.Contingency.non_convergent)
-			)
+		msg = constants.Contingency.convergence_messages[(bool(self.convergent_v_step), bool(self.convergent_v_steady))]
 		return msg
 
 	@property
@@ -1381,9 +1649,9 @@ class Contingency:
 		:return:
 		"""
 		for df in (self.circuits, self.tx2, self.tx3, self.fixed_shunts, self.switched_shunts):
-			# Convert input data for circuit ID to a string for all non-empty dataframes
-			if not df.empty:
-				# #df_status[constants.Branches.id].apply(str)
+			# Convert input data for circuit ID to a string for all non-empty dataframes, IDs are normally already
+			# strings when imported and so are only converted (creating a new column) where that is not the case
+			if not df.empty and not pd.api.types.is_string_dtype(df[constants.Branches.id]):
 				df[constants.Branches.id] = df[constants.Branches.id].astype('str')
 
 	def setup_contingency(
@@ -1408,42 +1676,28 @@ class Contingency:
 		if self.name == constants.Contingency.bc:
 			self.setup_correctly = True
 			self.logger.debug(
-				'Contingency {} is the base case and therefore no switching actions have taken place'.format(self.name)
+				'Contingency %s is the base case and therefore no switching actions have taken place', self.name
 			)
 			return None
 
-		# Iterate through each circuit and change status
+		# Iterate through each circuit, two winding transformer, three winding transformer, busbar, fixed shunt and
+		# switched shunt and change status, each asset is passed as a dictionary of its values rather than a Series
 		success = []
-		for i, row in self.circuits.iterrows():
-			success.append(circuit_data.change_state(asset=row, restore=restore))
-
-		# Iterate through each two winding transformer and change status
-		for i, row in self.tx2.iterrows():
-			success.append(tx2_data.change_state(asset=row, restore=restore))
-
-		# Iterate through each three winding transformer and change status
-		for i, row in self.tx3.iterrows():
-			success.append(tx3_data.change_state(asset=row, restore=restore))
-
-		# Iterate through each busbar and change state
-		for i, row in self.busbars.iterrows():
-			success.append(bus_data.change_state(asset=row, restore=restore))
-
-		# Iterate through each fixed shunts and change state
-		for i, row in self.fixed_shunts.iterrows():
-			success.append(fixed_shunt_data.change_state(asset=row, restore=restore))
-
-		# Iterate through each switched shunt and change state
-		for i, row in self.switched_shunts.iterrows():
-			success.append(switched_shunt_data.change_state(asset=row, restore=restore))
+		for assets, data in zip(
+				self.asset_records,
+				(circuit_data, tx2_data, tx3_data, bus_data, fixed_shunt_data, switched_shunt_data)
+		):
+			success.extend(data.change_state(asset=asset, restore=restore) for asset in assets)
 
 		if restore:
 			self.setup_correctly = False
 		else:
-			for data in (
-					circuit_data, tx2_data, tx3_data, tx3_wind_data, bus_data, switched_shunt_data, fixed_shunt_data
-			):
+			for data in (circuit_data, tx2_data, tx3_data, tx3_wind_data, bus_data):
 				data.update(cont_name=self.name)
+			# Shunts are only switched by the contingency itself and so their status is only retrieved from PSSE if
+			# this contingency includes shunts of that type
+			for assets, data in ((self.switched_shunts, switched_shunt_data), (self.fixed_shunts, fixed_shunt_data)):
+				data.update(cont_name=self.name, unchanged=assets.empty)
 			self.setup_correctly = all(success)
 
 		if not self.setup_correctly:
@@ -1482,8 +1736,8 @@ class Contingency:
 
 		# If using to establish reactive compensation requirement initially set machine output to 0 Mvar
 		if constants.ReactiveCompensationLimits.target_shunts:
-			for _, machine in constants.ReactiveCompensationLimits.target_machines.iteritems():
-				machine_data.change_output(bus_num=machine[0], machine_id=machine[1])
+			for bus_num, machine_id in constants.ReactiveCompensationLimits.target_machines.values():
+				machine_data.change_output(bus_num=bus_num, machine_id=machine_id)
 
 		# Run a load flow and check for convergence along with any islanded busbars
 		convergent_load_flow, islanded_buses = psse.run_load_flow(lock_taps=True)
@@ -1500,9 +1754,9 @@ class Contingency:
 		if not convergent_load_flow:
 			self.logger.info(
 				(
-					'Load flow for contingency {} is not convergent with fixed taps.  No busbar voltage or '
+					'Load flow for contingency %s is not convergent with fixed taps.  No busbar voltage or '
 					'circuit loading values will be returned'
-				).format(self.name))
+				), self.name)
 			self.convergent_v_step = False
 
 			# Update busbar data with non-convergence flag to leave as blank
@@ -1514,6 +1768,10 @@ class Contingency:
 
 		# Run load flow again to obtain steady_state voltages
 		# Updated the relevant aspects of bus_data for this contingency with the change in status
+		# If the fixed tap load flow diverged then the steady state load flow is started from the base case voltages
+		# rather than the diverged solution, a flat start is only used if it is still not convergent
+		if not self.convergent_v_step and psse.restore_base_voltages():
+			self.logger.debug('Steady state load flow for contingency %s started from base case voltages', self.name)
 		convergent_load_flow, _ = psse.run_load_flow(lock_taps=False)
 		if not convergent_load_flow:
 			# Run with flat start and then re-run with non-flat start
@@ -1540,9 +1798,9 @@ class Contingency:
 			if not convergent_load_flow:
 				self.logger.info(
 					(
-						'Contingency {} not convergent without reactive compensation but will now attempt to determine '
+						'Contingency %s not convergent without reactive compensation but will now attempt to determine '
 						'reactive compensation necessary to make convergent'
-					).format(self.name)
+					), self.name
 				)
 
 			# Confirm if voltages all within limits otherwise reduce target set-point until voltages within limits at
@@ -1599,11 +1857,12 @@ class Contingency:
 			targets_log[target_bus] = target_voltage
 
 			# Iterate through each machine and change values
-			for _, machine in c.target_machines.iteritems():
-				if c.target_shunts:
-					machine_data.change_output(bus_num=machine[0], machine_id=machine[1], q_target=target_q)
-				else:
-					machine_data.change_target(bus_num=machine[0], target=target_voltage, target_bus=target_bus)
+			if c.target_shunts:
+				for bus_num, machine_id in c.target_machines.values():
+					machine_data.change_output(bus_num=bus_num, machine_id=machine_id, q_target=target_q)
+			else:
+				for bus_num, _ in c.target_machines.values():
+					machine_data.change_target(bus_num=bus_num, target=target_voltage, target_bus=target_bus)
 
 			# Increment iter_count
 			iter_count += 1
@@ -1616,13 +1875,13 @@ class Contingency:
 				if convergent:
 					_, _ = psse.run_load_flow(flat_start=False)
 				elif c.target_shunts:
-					self.logger.info('\tNon-convergent for contingency {} with Q = {:.2f} Mvar'.format(self.name, target_q))
+					self.logger.info('\tNon-convergent for contingency %s with Q = %.2f Mvar', self.name, target_q)
 					within_limits = False
 					continue
 				else:
 					self.logger.info(
-						'\tNon-convergent for contingency {} with target_v = {:.3f} at bus {} p.u.'.format(
-							self.name, target_voltage, target_bus)
+						'\tNon-convergent for contingency %s with target_v = %.3f at bus %s p.u.',
+						self.name, target_voltage, target_bus
 					)
 					within_limits = False
 					continue
@@ -1637,20 +1896,30 @@ class Contingency:
 		return None
 
 
-
-
-
-
 class PsseControl:
 	"""
 		Class to obtain and store the PSSE data
 	"""
+	# Attributes are fixed and so are stored in slots rather than a dictionary
+	__slots__ = (
+		'logger', 'sav', 'sav_name', 'snapshot', 'sid', 'base_voltages', 'load_flows', 'func_solved', 'func_island',
+		'func_bus_int'
+	)
 
 	def __init__(self):
 		self.logger = logging.getLogger(constants.Logging.logger_name)
 		self.sav = str()
 		self.sav_name = str()
+		self.snapshot = str()
 		self.sid = -1
+		# Load flow functions are bound once PSSE has been initialised when the case is loaded, the load flow for each
+		# combination of (flat_start, lock_taps) is keyed by that combination
+		self.load_flows = dict()
+		self.func_solved = None
+		self.func_island = None
+		self.func_bus_int = None
+		# Busbar numbers and solved voltage magnitude / angle from the base case used to warm start load flows
+		self.base_voltages = None
 
 	def load_data_case(self, pth_sav=None):
 		"""
@@ -1686,11 +1955,128 @@ class PsseControl:
 								 .format(pth_sav, ierr, func.__name__))
 			raise ValueError('Unable to Load PSSE Case')
 
+		# Functions used for every load flow are bound once rather than looked up for each contingency
+		self.bind_load_flows()
+		self.func_solved = psspy.solved
+		self.func_island = psspy.island
+		self.func_bus_int = psspy.abusint
+
 		# Set the PSSE load flow tolerances to ensure all studies done with same parameters
 		self.set_load_flow_tolerances()
 
 		return None
 
+	def save_snapshot(self):
+		"""
+			Saves the current state of the case (i.e. the solved base case) to a temporary SAV case which is then
+			restored after each contingency rather than reloading the original SAV case
+		:return bool success:  True if the snapshot has been saved, otherwise the original SAV case continues to be
+			reloaded
+		"""
+		fd, pth_snapshot = tempfile.mkstemp(suffix='.sav', prefix='{}_'.format(self.sav_name))
+		os.close(fd)
+
+		func = psspy.save
+		ierr = func(pth_snapshot)
+		if ierr > 0:
+			self.logger.warning(('Unable to save snapshot of PSSE case to {} and so the original SAV case {} will be '
+								 'reloaded instead.  PSSE returned the error code {} from function {}')
+								.format(pth_snapshot, self.sav, ierr, func.__name__))
+			os.remove(pth_snapshot)
+			return False
+
+		self.snapshot = pth_snapshot
+		return True
+
+	def restore_snapshot(self):
+		"""
+			Restores the case to the snapshot saved by <save_snapshot>, if no snapshot is available then the original
+			SAV case is reloaded
+		:return None:
+		"""
+		if not self.snapshot:
+			self.load_data_case()
+			return None
+
+		func = psspy.case
+		ierr = func(sfile=self.snapshot)
+		if ierr > 0:
+			self.logger.critical(('Unable to restore snapshot {} of PSSE Saved Case file:  {}.\n'
+								  'PSSE returned the error code {} from function {}')
+								 .format(self.snapshot, self.sav, ierr, func.__name__))
+			raise ValueError('Unable to Restore PSSE Case')
+
+		# The load flow tolerances are saved as part of the case and so the snapshot already includes those set when
+		# the original SAV case was loaded
+		return None
+
+	def remove_snapshot(self):
+		"""
+			Deletes the temporary SAV case saved by <save_snapshot>
+		:return None:
+		"""
+		if self.snapshot and os.path.isfile(self.snapshot):
+			try:
+				os.remove(self.snapshot)
+			except OSError:
+				self.logger.warning('Unable to delete temporary snapshot {}'.format(self.snapshot))
+		self.snapshot = str()
+		return None
+
+	def save_base_voltages(self):
+		"""
+			Stores the solved busbar voltage magnitudes and angles so that a load flow which has diverged can be
+			restarted from the base case solution rather than a flat start.  Only the in service busbars are stored
+			since those out of service are not part of the solved network
+		:return None:
+		"""
+		c = constants.Busbars
+		func = psspy.abusint
+		ierr, iarray = func(sid=-1, flag=1, string=(c.bus,))
+		if ierr > 0:
+			self.logger.warning(('Unable to retrieve the busbar numbers from the SAV case and so load flows will not be '
+								 'warm started from the base case.  PSSE returned the error code {} from the function '
+								 '<{}>').format(ierr, func.__name__))
+			return None
+
+		func = psspy.abusreal
+		ierr, rarray = func(sid=-1, flag=1, string=(c.voltage, c.angle))
+		if ierr > 0:
+			self.logger.warning(('Unable to retrieve the busbar voltages from the SAV case and so load flows will not '
+								 'be warm started from the base case.  PSSE returned the error code {} from the '
+								 'function <{}>').format(ierr, func.__name__))
+			return None
+
+		self.base_voltages = list(zip(iarray[0], rarray[0], rarray[1]))
+		return None
+
+	def restore_base_voltages(self):
+		"""
+			Sets the busbar voltages back to the solved base case values saved by <save_base_voltages> without
+			changing the status of any of the switched elements, used as the initial conditions for the next load flow.
+			Busbars which cannot be restored keep their previous solution and are reported in a single warning
+		:return bool success:  True if the voltages have been restored for at least one busbar
+		"""
+		if not self.base_voltages:
+			return False
+
+		# Function bound once rather than looked up for every busbar
+		func = psspy.bus_chng_3
+		failed_busbars = list()
+		for bus, voltage, angle in self.base_voltages:
+			ierr = func(i=bus, realar2=voltage, realar3=angle)
+			if ierr > 0:
+				failed_busbars.append(bus)
+
+		if failed_busbars:
+			self.logger.warning(('Unable to restore the base case voltages for {} of {} busbars and so these will '
+								 'start the load flow from the previous solution.  PSSE returned errors from the '
+								 'function <{}> for the busbars: {}').format(
+				len(failed_busbars), len(self.base_voltages), func.__name__, failed_busbars
+			))
+
+		return len(failed_busbars) < len(self.base_voltages)
+
 	def set_load_flow_tolerances(self):
 		"""
 			Function sets the tolerances for when performing Load Flow studies
@@ -1709,6 +2095,49 @@ class PsseControl:
 								.format(constants.PSSE.max_iterations, ierr, func.__name__))
 		return None
 
+	def bind_load_flows(self):
+		"""
+			Binds the load flow function and its options for every combination of flat start and tap locking so that
+			these are not worked out again for every load flow
+		:return None:
+		"""
+		for flat_start in (False, True):
+			if flat_start:
+				# If a flat start has been requested then must use the "Fixed Slope Decoupled Newton-Raphson Power Flow
+				# Equations"
+				func = psspy.fdns
+			else:
+				# If flat start has not been requested then use "Newton Raphson Power Flow Calculation"
+				func = psspy.fnsl
+
+			for lock_taps in (False, True):
+				if lock_taps:
+					# Lock all taps and adjustment of shunts
+					tap_changing = 0
+					shunt_adjustment = 0
+				else:
+					# Enable stepping tab adjustment and continuous shunt adjustment (disable discrete)
+					tap_changing = 1
+					shunt_adjustment = 2
+
+				# Unless a flat start is requested the load flow is started from the previous solution (i.e. the solved
+				# base case snapshot or the previous load flow for this contingency), PSSE does not provide any option to
+				# reuse the factorised admittance matrix between load flows even where the topology is unchanged (shunt
+				# switching).
+				# TODO: Define these in constants
+				self.load_flows[(flat_start, lock_taps)] = functools.partial(
+					func,
+					options1=tap_changing,  # Tap changer stepping enabled
+					options2=0,  # Don't enable tie line flows
+					options3=0,  # Phase shifting adjustment disabled
+					options4=0,  # DC tap adjustment disabled
+					options5=shunt_adjustment,  # Include switched shunt adjustment
+					options6=int(flat_start),  # Flat start depends on status of <flat_start> input
+					options7=0,  # Apply VAR limits immediately
+					options8=0)  # Non divergent solution
+
+		return None
+
 	def run_load_flow(self, flat_start=False, lock_taps=False):
 		"""
 			Function to run a load flow on the psse model for the contingency, if it is not possible will
@@ -1719,34 +2148,8 @@ class PsseControl:
 			Returns True / False based on convergent load flow existing
 			If islanded busbars then disconnects them and returns details of all the islanded busbars in a DataFrame
 		"""
-		# Function declarations
-		if flat_start:
-			# If a flat start has been requested then must use the "Fixed Slope Decoupled Newton-Raphson Power Flow Equations"
-			func = psspy.fdns
-		else:
-			# If flat start has not been requested then use "Newton Raphson Power Flow Calculation"
-			func = psspy.fnsl
-
-		if lock_taps:
-			# Lock all taps and adjustment of shunts
-			tap_changing = 0
-			shunt_adjustment = 0
-		else:
-			# Enable stepping tab adjustment and continuous shunt adjustment (disable discrete)
-			tap_changing = 1
-			shunt_adjustment = 2
-
-		# Run loadflow with screen output controlled
-		# TODO: Define these in constants
-		ierr = func(
-			options1=tap_changing,  # Tap changer stepping enabled
-			options2=0,  # Don't enable tie line flows
-			options3=0,  # Phase shifting adjustment disabled
-			options4=0,  # DC tap adjustment disabled
-			options5=shunt_adjustment,  # Include switched shunt adjustment
-			options6=flat_start,  # Flat start depends on status of <flat_start> input
-			options7=0,  # Apply VAR limits immediately
-			options8=0)  # Non divergent solution
+		# Run loadflow with the options already set for this combination of flat start and tap locking
+		ierr = self.load_flows[(bool(flat_start), bool(lock_taps))]()
 
 		# Error checking
 		if ierr == 1 or ierr == 5:
@@ -1778,19 +2181,52 @@ class PsseControl:
 			Function to check if the previous load flow was convergent
 		:return bool conergent:  True if convergent and false if not
 		"""
-		error = psspy.solved()
+		error = self.func_solved()
+		# Convergent load flows are the most common result and so are returned without any further checks
 		if error == 0:
-			convergent = True
-		elif error in (1, 2, 3, 5):
+			return True
+
+		if error in (1, 2, 3, 5):
 			self.logger.debug(
-				'Non-convergent load flow due to a non-convergent case with error code {}'.format(error))
-			convergent = False
+				'Non-convergent load flow due to a non-convergent case with error code %s', error)
 		else:
 			self.logger.error(
 				'Non-convergent load flow due to script error or user input with error code {}'.format(error))
-			convergent = False
 
-		return convergent
+		return False
+
+	def get_in_service_busbars(self):
+		"""
+			Function returns the number and type code of every in service busbar, only these are needed to identify
+			islanded busbars and so are retrieved from PSSE in a single call rather than populating a new <BusData>
+		:return (np.ndarray, np.ndarray) (busbars, states): Arrays of the in service busbar numbers and their type codes
+		"""
+		c = constants.Busbars
+		func = self.func_bus_int
+		ierr, iarray = func(sid=-1, flag=1, string=(c.bus, c.state))
+		if ierr > 0:
+			self.logger.critical(('Unable to retrieve the busbar type codes from the SAV case and PSSE returned the '
+								  'following error code {} from the function <{}>')
+								 .format(ierr, func.__name__))
+			raise SyntaxError('Error importing data from PSSE SAV case')
+
+		# Arrays returned directly since a DataFrame is only needed for any busbars which are disconnected
+		return np.asarray(iarray[0], dtype=np.int64), np.asarray(iarray[1], dtype=np.int64)
+
+	def get_in_service_busbar_numbers(self):
+		"""
+			Function returns only the numbers of every in service busbar
+		:return np.ndarray busbars: Array of the in service busbar numbers
+		"""
+		func = self.func_bus_int
+		ierr, iarray = func(sid=-1, flag=1, string=(constants.Busbars.bus,))
+		if ierr > 0:
+			self.logger.critical(('Unable to retrieve the busbar numbers from the SAV case and PSSE returned the '
+								  'following error code {} from the function <{}>')
+								 .format(ierr, func.__name__))
+			raise SyntaxError('Error importing data from PSSE SAV case')
+
+		return np.asarray(iarray[0], dtype=np.int64)
 
 	def get_islanded_busbars(self):
 		"""Function to retrieve any islanded busbars in PSSE
@@ -1802,25 +2238,33 @@ class PsseControl:
 
 		:return pd.DataFrame busbars: DataFrame of the busbars that have been disconnected as part of this contingency
 		"""
-		# Get list of all busbars which are in service
-		# busbars_initial = handle to class <bus_data> before any changes have been made
-		busbars_initial = BusData(flag=1).df_state
+		# Get list of all busbars which are in service before any changes have been made
+		busbars_initial, states_initial = self.get_in_service_busbars()
 
 		# Run ISLAND function to trip out any in-service branches connected to type 4 buses and disconnects islands
 		#   that don't contain a swing bus
-		func = psspy.island
+		func = self.func_island
 		ierr = func()
 		if ierr == -1:
 			self.logger.critical('There are no in-service buses remaining after taking this contingency')
 			raise IOError('There are no in-service buses remaining after taking this contingency')
 
-		# Get list of all busbars which are now in service
-		busbars_final = BusData(flag=1).df_state
+		# Get numbers of all busbars which are now in service, the type codes are not needed for these busbars
+		busbars_final = self.get_in_service_busbar_numbers()
+
+		# ISLAND only ever removes busbars and so if the same number are in service nothing has been disconnected,
+		# otherwise those which were in service initially but are not now are the ones which have been disconnected
+		if len(busbars_final) == len(busbars_initial):
+			disconnected = np.zeros(len(busbars_initial), dtype=bool)
+		else:
+			disconnected = ~np.isin(busbars_initial, busbars_final, assume_unique=True)
 
-		# Compared those which were in service initially and those which are in service now and return those which
-		# are updated DataFrame to only show those which are not duplicated
-		df_disconnected_busbars = pd.concat([busbars_initial, busbars_final])
-		df_disconnected_busbars.drop_duplicates(subset=constants.Busbars.bus, keep=False, inplace=True)
+		# DataFrame only built for the disconnected busbars and indexed by busbar number
+		c = constants.Busbars
+		df_disconnected_busbars = pd.DataFrame(
+			data={c.bus: busbars_initial[disconnected], c.state: states_initial[disconnected]},
+			index=pd.Index(busbars_initial[disconnected], name=c.bus)
+		)
 
 		return df_disconnected_busbars
 
@@ -1835,8 +2279,8 @@ class PsseControl:
 
 		sid = constants.PSSE.sid
 
-		min_voltage = min([min(x) for x in constants.EirGridThresholds.steady_state_limits.keys()])
-		max_voltage = max([max(x) for x in constants.EirGridThresholds.steady_state_limits.keys()])
+		min_voltage = constants.EirGridThresholds.min_nominal
+		max_voltage = constants.EirGridThresholds.max_nominal
 
 		# #area = constants.PSSE.area
 		# #zone = constants.PSSE.zone
@@ -1880,14 +2324,18 @@ class PsseControl:
 	def get_fault_currents(self):
 		"""
 			Using PSSARRAYS module to return fault currents
-		:return pd.DataFrame() df:  DataFrame of the ik'' fault currents for every busbar in this study case
+		:return pd.DataFrame() df:  DataFrame of the ik'' fault currents (float32) for every busbar in this study case
 		"""
 		# Obtain the Ik'' fault current for every busbar in the system
 		rlst = pssarrays.iecs_currents(all=1, flt3ph=1)
 
-		# Convert results into a dictionary
-		results = {bus: abs(rlst.flt3ph[i].ia1) for i, bus in enumerate(rlst.fltbus)}
-		df = pd.DataFrame.from_dict(data=results, orient='index', columns=[self.sav_name])
+		# Positive sequence currents collected into a single complex array so the magnitudes are calculated at once,
+		# the busbar numbers are converted straight to an integer array for the index
+		busbars = np.asarray(rlst.fltbus, dtype=np.int64)
+		currents = np.fromiter((flt.ia1 for flt in rlst.flt3ph), dtype=complex, count=len(busbars))
+		# Magnitudes are only reported to a few significant figures and so are stored at single precision which halves
+		# the size of the results when those from many study cases are combined
+		df = pd.DataFrame(data={self.sav_name: np.abs(currents).astype(np.float32)}, index=busbars)
 
 		return df
 
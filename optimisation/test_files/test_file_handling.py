@@ -2,6 +2,10 @@ import unittest
 import os
 import sys
 import time
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
 
 TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -27,6 +31,15 @@ class TestImportContingencies(unittest.TestCase):
 		file_path = os.path.join(TESTS_DIR, 'Contingencies_full.xlsx')
 		cls.contingency_data = TestModule.ImportContingencies(pth=file_path)
 
+	def setUp(self):
+		# Temporary directory only created by tests which need to write files
+		self.tmp_dir = None
+
+	def tearDown(self):
+		# Removes the temporary copy of the workbook and the cache file created alongside it
+		if self.tmp_dir is not None:
+			shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
 	def test_import_cont_empty(self):
 		"""
 			Test that importing an empty contingency file raises an error
@@ -51,6 +64,24 @@ class TestImportContingencies(unittest.TestCase):
 		self.assertTrue(len(contingency_data.contingency_names) == 4)
 		print(contingency_data.circuits)
 
+	def test_import_cached(self):
+		"""
+			Test that contingencies loaded from the cache match those imported from the workbook
+		:return:
+		"""
+		# Workbook copied to a temporary directory so that the cache file is not created alongside the test files
+		self.tmp_dir = tempfile.mkdtemp()
+		file_path = os.path.join(self.tmp_dir, 'Contingencies_full.xlsx')
+		shutil.copy2(os.path.join(TESTS_DIR, 'Contingencies_full.xlsx'), file_path)
+
+		contingency_data = TestModule.ImportContingencies(pth=file_path, use_cache=False)
+		cached_data = TestModule.ImportContingencies(pth=file_path, use_cache=True)
+		self.assertTrue(os.path.isfile(cached_data.pth_cache))
+		self.assertTrue(cached_data.load_cache())
+		self.assertTrue(contingency_data.circuits.equals(cached_data.circuits))
+		self.assertTrue(contingency_data.tx3.equals(cached_data.tx3))
+		self.assertEqual(contingency_data.contingency_names, cached_data.contingency_names)
+
 	def test_import_full(self):
 		"""
 			Test that importing a complete contingnecy file operates correctly
@@ -62,6 +93,19 @@ class TestImportContingencies(unittest.TestCase):
 		self.assertEqual(len(self.contingency_data.busbars), 1)
 		self.assertEqual(len(self.contingency_data.contingency_names), 10)
 
+	def test_contingency_names(self):
+		"""
+			Test that the contingency names are the sorted unique names from all of the contingency types
+		:return:
+		"""
+		names = set()
+		for df in (
+				self.contingency_data.circuits, self.contingency_data.tx2, self.contingency_data.tx3,
+				self.contingency_data.busbars, self.contingency_data.fixed_shunts, self.contingency_data.switched_shunts
+		):
+			names.update(df[constants.Contingency.header].dropna().tolist())
+		self.assertEqual(self.contingency_data.contingency_names, sorted(names))
+
 	def test_contingency_grouping_contH(self):
 		"""
 			Test extraction of a single contingency works as expected
@@ -101,5 +145,104 @@ class TestImportContingencies(unittest.TestCase):
 
 		print('{}'.format(self.contingency_data.circuits[constants.Excel.id][1]))
 
+	def test_normalise_id(self):
+		"""
+			Tests that numeric IDs are converted to strings and string IDs are retained as entered
+		:return:
+		"""
+		ids = TestModule.normalise_id(ids=pd.Series([1, 2.0, '01', 'SH']))
+		self.assertEqual(ids.tolist(), ['1', '2', '01', 'SH'])
+
+
+class TestExportResults(unittest.TestCase):
+	"""
+		Functions to check that the results are exported correctly
+	"""
+	def setUp(self):
+		"""
+			Produces a set of results to export
+		"""
+		self.pth_workbook = os.path.join(TESTS_DIR, 'Results_export.xlsx')
+		self.df_status = pd.DataFrame(
+			data={'NAME': ['Busbar A', 'Busbar B'], constants.Contingency.bc: [1, 1], 'Test A': [1, np.nan]},
+			index=[200, 100]
+		)
+		self.convergence = pd.DataFrame(data={constants.Excel.convergence: [True, False]}, index=['Test A', 'Test B'])
+		self.results = dict()
+		self.results[constants.Excel.circuit_status] = self.df_status.copy()
+
+	def tearDown(self):
+		if os.path.isfile(self.pth_workbook):
+			os.remove(self.pth_workbook)
+
+	def test_export_workbook(self):
+		"""
+			Test that the exported workbook contains the same results as pandas would have written
+		:return:
+		"""
+		TestModule.ExportResults(pth_workbook=self.pth_workbook, results=self.results, convergence=self.convergence)
+
+		df = pd.read_excel(self.pth_workbook, sheet_name=constants.Excel.circuit_status, index_col=0)
+		pd.testing.assert_frame_equal(df, self.df_status.sort_index(), check_dtype=False)
+		df = pd.read_excel(self.pth_workbook, sheet_name=constants.Excel.convergence, index_col=0)
+		pd.testing.assert_frame_equal(df, self.convergence)
+		df = pd.read_excel(
+			self.pth_workbook, sheet_name='{}_T'.format(constants.Excel.circuit_status), index_col=0
+		)
+		self.assertEqual(df.columns.tolist(), [100, 200])
+
+	def test_export_without_transposed(self):
+		"""
+			Test that the transposed copy of the results is only written when requested
+		:return:
+		"""
+		TestModule.ExportResults(
+			pth_workbook=self.pth_workbook, results=self.results, convergence=self.convergence,
+			include_transposed=False
+		)
+
+		sheets = pd.ExcelFile(self.pth_workbook).sheet_names
+		self.assertEqual(sheets, [constants.Excel.convergence, constants.Excel.circuit_status])
+
+	def test_export_labelled_rows(self):
+		"""
+			Test that results with both busbar numbers and labels in the index are exported with the labels last
+		:return:
+		"""
+		self.df_status.loc[constants.Contingency.compliant] = [np.nan, True, False]
+		self.results[constants.Excel.circuit_status] = self.df_status
+		TestModule.ExportResults(pth_workbook=self.pth_workbook, results=self.results, convergence=self.convergence)
+
+		df = pd.read_excel(self.pth_workbook, sheet_name=constants.Excel.circuit_status, index_col=0)
+		self.assertEqual(df.index.tolist(), [100, 200, constants.Contingency.compliant])
+
+	def test_export_numeric_results(self):
+		"""
+			Test that results which only contain numbers are exported with empty cells left blank
+		:return:
+		"""
+		df_numeric = self.df_status.drop(columns='NAME')
+		self.results[constants.Excel.circuit_status] = df_numeric
+		TestModule.ExportResults(pth_workbook=self.pth_workbook, results=self.results, convergence=self.convergence)
+
+		df = pd.read_excel(self.pth_workbook, sheet_name=constants.Excel.circuit_status, index_col=0)
+		pd.testing.assert_frame_equal(df, df_numeric.sort_index(), check_dtype=False)
+		df = pd.read_excel(
+			self.pth_workbook, sheet_name='{}_T'.format(constants.Excel.circuit_status), index_col=0
+		)
+		pd.testing.assert_frame_equal(df, df_numeric.sort_index().T, check_dtype=False)
+
+	def test_export_empty_results(self):
+		"""
+			Test that empty results are written as a sheet without a transposed copy
+		:return:
+		"""
+		self.results[constants.Excel.circuit_status] = pd.DataFrame()
+		TestModule.ExportResults(pth_workbook=self.pth_workbook, results=self.results, convergence=self.convergence)
+
+		sheets = pd.ExcelFile(self.pth_workbook).sheet_names
+		self.assertEqual(sheets, [constants.Excel.convergence, constants.Excel.circuit_status])
+
+
 if __name__ == '__main__':
 	unittest.main()
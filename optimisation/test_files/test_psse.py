@@ -65,6 +65,18 @@ class TestPsseInitialise(unittest.TestCase):
 		status = self.psse.initialise_psse()
 		self.assertTrue(status)
 
+	def test_psse35_psspy_import_success(self):
+		"""
+			Test that PSSE version 35 can be initialised
+		:return:
+		"""
+		self.psse = TestModule.InitialisePsspy(psse_version=35)
+		self.assertIsNotNone(self.psse.psspy)
+
+		# Initialise psse
+		status = self.psse.initialise_psse()
+		self.assertTrue(status)
+
 	def tearDown(self):
 		"""
 			Tidy up by removing variables and paths that are not necessary
@@ -190,8 +202,27 @@ class TestApplyPsseContingencies(unittest.TestCase):
 		# Initialise logger
 		cls.logger = optimisation.Logger(pth_logs=TEST_LOGS, uid='TestApplyContingencies', debug=True)
 
-		# Initialise and load PSSE SAV case
+		# Initialise and load PSSE SAV case once, a snapshot is saved which each test restores rather than reloading
+		# the SAV case from disk
 		cls.psse = TestModule.PsseControl()
+		cls.psse.load_data_case(pth_sav=SAV_CASE_COMPLETE)
+		cls.psse.save_snapshot()
+
+	def setUp(self):
+		"""
+			Restores the PSSE case to the snapshot and obtains new technical data from it so that no results from
+			an earlier test are carried into the next
+		"""
+		self.psse.restore_snapshot()
+
+		# Obtain technical data from PSSE
+		self.circuit_data = TestModule.BranchData(flag=2)
+		self.tx2_data = TestModule.BranchData(flag=6, tx=True)
+		self.tx3_data = TestModule.Tx3Data()
+		self.bus_data = TestModule.BusData()
+		self.tx3_wind_data = optimisation.psse.Tx3WndData()
+		self.fixed_shunt_data = optimisation.psse.ShuntData(fixed=True)
+		self.switched_shunt_data = optimisation.psse.ShuntData(fixed=False)
 
 	def test_contingency_not_ready(self):
 			"""
@@ -212,17 +243,14 @@ class TestApplyPsseContingencies(unittest.TestCase):
 		self.assertTrue(all(data_type_is_string))
 
 	def test_switch_out_circuit(self):
-		# Load PSSE sav case
-		self.psse.load_data_case(pth_sav=SAV_CASE_COMPLETE)
-
-		# Obtain technical data from PSSE
-		circuit_data = TestModule.BranchData(flag=2)
-		tx2_data = TestModule.BranchData(flag=6, tx=True)
-		tx3_data = TestModule.Tx3Data()
-		bus_data = TestModule.BusData()
-		tx3_wind_data = optimisation.psse.Tx3WndData()
-		fixed_shunt_data = optimisation.psse.ShuntData(fixed=True)
-		switched_shunt_data = optimisation.psse.ShuntData(fixed=False)
+		# Technical data obtained from PSSE for this test
+		circuit_data = self.circuit_data
+		tx2_data = self.tx2_data
+		tx3_data = self.tx3_data
+		bus_data = self.bus_data
+		tx3_wind_data = self.tx3_wind_data
+		fixed_shunt_data = self.fixed_shunt_data
+		switched_shunt_data = self.switched_shunt_data
 
 
 		self.cont_circuit.setup_contingency(circuit_data=circuit_data, tx2_data=tx2_data,
@@ -246,17 +274,14 @@ class TestApplyPsseContingencies(unittest.TestCase):
 		self.assertFalse(self.cont_circuit.setup_correctly)
 
 	def test_switch_out_tx3(self):
-		# Load PSSE sav case
-		self.psse.load_data_case(pth_sav=SAV_CASE_COMPLETE)
-
-		# Obtain technical data from PSSE
-		circuit_data = TestModule.BranchData(flag=2)
-		tx2_data = TestModule.BranchData(flag=6, tx=True)
-		tx3_data = TestModule.Tx3Data()
-		bus_data = TestModule.BusData()
-		tx3_wind_data = optimisation.psse.Tx3WndData()
-		fixed_shunt_data = optimisation.psse.ShuntData(fixed=True)
-		switched_shunt_data = optimisation.psse.ShuntData(fixed=False)
+		# Technical data obtained from PSSE for this test
+		circuit_data = self.circuit_data
+		tx2_data = self.tx2_data
+		tx3_data = self.tx3_data
+		bus_data = self.bus_data
+		tx3_wind_data = self.tx3_wind_data
+		fixed_shunt_data = self.fixed_shunt_data
+		switched_shunt_data = self.switched_shunt_data
 
 		self.cont_tx3.setup_contingency(circuit_data=circuit_data, tx2_data=tx2_data,
 										tx3_data=tx3_data, tx3_wind_data=tx3_wind_data,
@@ -278,17 +303,14 @@ class TestApplyPsseContingencies(unittest.TestCase):
 		self.assertFalse(self.cont_tx3.setup_correctly)
 
 	def test_switch_out_circuit_reversed(self):
-		# Load PSSE sav case
-		self.psse.load_data_case(pth_sav=SAV_CASE_COMPLETE)
-
-		# Obtain technical data from PSSE
-		circuit_data = TestModule.BranchData(flag=2)
-		tx2_data = TestModule.BranchData(flag=6, tx=True)
-		tx3_data = TestModule.Tx3Data()
-		bus_data = TestModule.BusData()
-		tx3_wind_data = optimisation.psse.Tx3WndData()
-		fixed_shunt_data = optimisation.psse.ShuntData(fixed=True)
-		switched_shunt_data = optimisation.psse.ShuntData(fixed=False)
+		# Technical data obtained from PSSE for this test
+		circuit_data = self.circuit_data
+		tx2_data = self.tx2_data
+		tx3_data = self.tx3_data
+		bus_data = self.bus_data
+		tx3_wind_data = self.tx3_wind_data
+		fixed_shunt_data = self.fixed_shunt_data
+		switched_shunt_data = self.switched_shunt_data
 
 		self.cont_circuit2.setup_contingency(circuit_data=circuit_data, tx2_data=tx2_data,
 											 tx3_data=tx3_data, tx3_wind_data=tx3_wind_data,
@@ -312,6 +334,7 @@ class TestApplyPsseContingencies(unittest.TestCase):
 
 	@classmethod
 	def tearDownClass(cls):
+		cls.psse.remove_snapshot()
 		# Delete log files created by logger once completed but only if success
 		if DELETE_LOG_FILES:
 			paths = [cls.logger.pth_debug_log,